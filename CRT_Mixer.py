@@ -1,16 +1,37 @@
 import json
+import mmap
+import multiprocessing
 import os
 import sys
-
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+import numpy as np
 from PIL import Image
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import (
+    QObject,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QImage, QImageReader, QPainter, QPixmap
 from PyQt5.QtWidgets import (
     QAction,
     QApplication,
     QCheckBox,
     QComboBox,
     QFileDialog,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+    QGraphicsView,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -25,15 +46,129 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from artifacting import apply_artifacting
-from crt_filter import apply_crt_filter
-from noise_overlay import apply_noise_overlay
-from pixel_sorter_parallel import sort_all_pixels, sort_pixels_parallel
-from rgb_distortion import (
-    apply_channel_swap,
-    apply_chromatic_aberration,
-    apply_rgb_shift,
-)
+from effects_pipeline import apply_effects, has_effects, import_effects, init_worker
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once at import rather than on every use
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_PATH = os.path.join(APP_DIR, "logo.svg")
+# Recent lists written by older versions, read once if QSettings has none:
+# a single JSON document, and before that one line-per-path file per list
+LEGACY_STATE_PATH = os.path.expanduser("~/.crt_mixer_state.json")
+LEGACY_RECENT_FILES_PATH = os.path.expanduser("~/.crt_mixer_recent")
+LEGACY_RECENT_PROJECTS_PATH = os.path.expanduser("~/.crt_mixer_recent_projects")
+
+
+def remove_file_quietly(path):
+    """Delete a temp file, printing a warning instead of raising on failure."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"Warning: Could not delete temp file {path}: {e}")
+
+
+def dump_json(data):
+    """Encode data as indented UTF-8 JSON bytes, with orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def load_json(data):
+    """Decode JSON bytes, with orjson if installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path):
+    """Parse a JSON file, reading it through a memory map."""
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:]
+        except ValueError:
+            # Empty files can't be mapped (the decoder then reports the error)
+            data = f.read()
+    return load_json(data)
+
+
+def pixmap_from_array(pixels):
+    """Wrap a uint8 RGB array (H x W x 3) in a QPixmap without encoding it."""
+    pixels = np.ascontiguousarray(pixels)
+    height, width = pixels.shape[:2]
+    image = QImage(pixels.data, width, height, pixels.strides[0], QImage.Format_RGB888)
+    return QPixmap.fromImage(image)
+
+
+class EffectsWorkerSignals(QObject):
+    """Signals for EffectsWorker (QRunnable is not a QObject and can't own signals)."""
+
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class EffectsWorker(QRunnable):
+    """Run the effects pipeline on a QThreadPool thread, off the GUI thread."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = EffectsWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"[ERROR] Processing failed: {traceback.format_exc()}")
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+
+class PreviewView(QGraphicsView):
+    """Preview area that keeps its pixmap scaled to fit the view.
+
+    Swapping the pixmap item only repaints the scene, and the fit is done
+    by the view transform at paint time instead of resampling each frame.
+    """
+
+    def __init__(self, placeholder, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setRenderHint(QPainter.SmoothPixmapTransform)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.placeholder_item = self.scene().addText(placeholder)
+        self.pixmap_item = QGraphicsPixmapItem()
+        self.pixmap_item.setTransformationMode(Qt.SmoothTransformation)
+        self.scene().addItem(self.pixmap_item)
+
+    def pixmap(self):
+        return self.pixmap_item.pixmap()
+
+    def set_pixmap(self, pixmap):
+        self.placeholder_item.hide()
+        self.pixmap_item.setPixmap(pixmap)
+        self.scene().setSceneRect(self.pixmap_item.boundingRect())
+        self.fit_pixmap()
+
+    def fit_pixmap(self):
+        if not self.pixmap_item.pixmap().isNull():
+            self.fitInView(self.pixmap_item, Qt.KeepAspectRatio)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fit_pixmap()
 
 
 class FullResPreviewWindow(QMainWindow):
@@ -92,64 +227,211 @@ class FullResPreviewWindow(QMainWindow):
 
         layout.addLayout(controls_layout)
 
-        # Load image
-        self.original_pixmap = QPixmap(image_path)
+        # Load image. The first view is fit-to-window, so decode straight to
+        # roughly window size; the full resolution pixmap is only decoded once
+        # a zoom level actually needs it.
+        self.image_path = image_path
+        reader = QImageReader(image_path)
+        self.image_size = reader.size()
+        fit_size = self.image_size.scaled(
+            self.width() - 20, self.height() - 20, Qt.KeepAspectRatio
+        )
+        if fit_size.width() < self.image_size.width():
+            reader.setScaledSize(fit_size)
+            self.original_pixmap = None
+            self.fit_pixmap = QPixmap.fromImage(reader.read())
+        else:
+            self.original_pixmap = QPixmap.fromImage(reader.read())
+            self.fit_pixmap = self.original_pixmap
+        # Scaled pixmaps for the fixed zoom levels, built on first use, so
+        # toggling between zoom buttons doesn't resample the image again
+        self._zoom_cache = {}
+        # Likewise for fit-to-window, as (target size, pixmap); a resized
+        # window changes the target size, so a stale entry never matches
+        self._fit_cache = None
         self.scroll_area = scroll
+        # New zoom levels are shown with a fast resample first and redone
+        # smoothly once the user stops clicking through them
+        self._current_scale = None
+        self._quality_timer = QTimer(self)
+        self._quality_timer.setSingleShot(True)
+        self._quality_timer.setInterval(150)
+        self._quality_timer.timeout.connect(self._rerender_smooth)
         self.set_zoom("fit")
 
+    def full_pixmap(self):
+        """Return the full resolution pixmap, decoding it on first use."""
+        if self.original_pixmap is None:
+            self.original_pixmap = QPixmap(self.image_path)
+        return self.original_pixmap
+
     def set_zoom(self, scale):
         """Set zoom level. scale can be a float or 'fit'."""
+        self._current_scale = scale
         if scale == "fit":
             # Fit to window
-            available_size = self.scroll_area.size()
-            scaled = self.original_pixmap.scaled(
-                available_size.width() - 20,
-                available_size.height() - 20,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            self.image_label.setPixmap(scaled)
+            if self._fit_cache and self._fit_cache[0] == self._fit_size():
+                self.image_label.setPixmap(self._fit_cache[1])
+                self._quality_timer.stop()
+            else:
+                self.image_label.setPixmap(self._scaled(scale, Qt.FastTransformation))
+                self._quality_timer.start()
             self.scroll_area.setWidgetResizable(True)
         else:
             # Scale by factor
-            new_width = int(self.original_pixmap.width() * scale)
-            new_height = int(self.original_pixmap.height() * scale)
-            scaled = self.original_pixmap.scaled(
-                new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
+            scaled = self._zoom_cache.get(scale)
+            if scaled is None and scale == 1.0:
+                # 100% is the decoded image itself; nothing to resample
+                scaled = self._zoom_cache[scale] = self.full_pixmap()
+            if scaled is None:
+                scaled = self._scaled(scale, Qt.FastTransformation)
+                self._quality_timer.start()
+            else:
+                self._quality_timer.stop()
             self.image_label.setPixmap(scaled)
             self.scroll_area.setWidgetResizable(False)
             self.image_label.adjustSize()
 
+    def _scaled(self, scale, mode):
+        """Resample the image for a zoom level with the given transformation."""
+        if scale == "fit":
+            target = self._fit_size()
+            # The window-sized decode is enough unless the window has grown
+            if target.width() <= self.fit_pixmap.width():
+                source = self.fit_pixmap
+            else:
+                source = self.full_pixmap()
+            return source.scaled(target, Qt.KeepAspectRatio, mode)
+
+        new_width = int(self.image_size.width() * scale)
+        new_height = int(self.image_size.height() * scale)
+        return self.full_pixmap().scaled(
+            new_width, new_height, Qt.KeepAspectRatio, mode
+        )
+
+    def _fit_size(self):
+        """Return the image size scaled to fit the scroll area."""
+        available_size = self.scroll_area.size()
+        return self.image_size.scaled(
+            available_size.width() - 20,
+            available_size.height() - 20,
+            Qt.KeepAspectRatio,
+        )
+
+    def _rerender_smooth(self):
+        """Replace the fast preview of the current zoom with a smooth one."""
+        scale = self._current_scale
+        scaled = self._scaled(scale, Qt.SmoothTransformation)
+        if scale == "fit":
+            self._fit_cache = (self._fit_size(), scaled)
+        else:
+            self._zoom_cache[scale] = scaled
+        self.image_label.setPixmap(scaled)
+
     def closeEvent(self, event):
         """Clean up temp file when window closes."""
-        if (
-            hasattr(self, "temp_file_path")
-            and self.temp_file_path
-            and os.path.exists(self.temp_file_path)
-        ):
-            try:
-                os.unlink(self.temp_file_path)
-            except (OSError, PermissionError) as e:
-                print(f"Warning: Could not delete temp file {self.temp_file_path}: {e}")
+        self._quality_timer.stop()
+        if self.temp_file_path:
+            # Deleting a large file can stall on slow disks; don't hold up the
+            # close. A plain thread rather than a QThreadPool: see thread_pool
+            # in PixelSorterApp.
+            threading.Thread(
+                target=remove_file_quietly, args=(self.temp_file_path,)
+            ).start()
+            self.temp_file_path = None
         event.accept()
 
 
 class PixelSorterApp(QMainWindow):
+    # Bounding box of the downsampled copy that previews are rendered from;
+    # the same size sort_pixels_parallel already shrinks to in preview mode
+    PREVIEW_MAX_SIZE = (800, 800)
+
+    # Bounds for the live preview debounce, which follows the render time
+    PREVIEW_DEBOUNCE_MIN_MS = 120
+    PREVIEW_DEBOUNCE_MAX_MS = 1500
+
+    # (control attribute, signal) pairs that trigger a live preview update
+    LIVE_PREVIEW_SIGNALS = (
+        # Sorting controls
+        ("mode_combo", "currentIndexChanged"),
+        ("direction_combo", "currentIndexChanged"),
+        ("threshold_slider", "valueChanged"),
+        ("reverse_check", "stateChanged"),
+        ("sort_all_check", "stateChanged"),
+        ("no_sort_check", "stateChanged"),
+        # RGB controls
+        ("channel_swap_combo", "currentIndexChanged"),
+        ("red_shift", "valueChanged"),
+        ("green_shift", "valueChanged"),
+        ("blue_shift", "valueChanged"),
+        ("chroma_slider", "valueChanged"),
+        # CRT controls
+        ("crt_check", "stateChanged"),
+        ("scanline_slider", "valueChanged"),
+        ("scanline_thick_slider", "valueChanged"),
+        ("scanline_count_slider", "valueChanged"),
+        ("curvature_slider", "valueChanged"),
+        ("crt_brightness_slider", "valueChanged"),
+        ("phosphor_glow_slider", "valueChanged"),
+        # Noise controls
+        ("noise_check", "stateChanged"),
+        ("noise_type_combo", "currentIndexChanged"),
+        ("noise_intensity_slider", "valueChanged"),
+        # Artifacting controls
+        ("artifact_check", "stateChanged"),
+        ("artifact_type_combo", "currentIndexChanged"),
+        ("artifact_intensity_slider", "valueChanged"),
+    )
+
     def __init__(self):
         super().__init__()
         self.input_path = None
+        self.input_basename = None  # os.path.basename(input_path), for labels
+        self._preview_src_path = None  # Decoded, downsampled copy of the input
+        self._preview_scale = 1.0  # Its width relative to the input's
         self.is_video = False
         self.recent_files = []
         self.recent_projects = []
         self.max_recent_files = 10
         self.max_recent_projects = 10
-        self.load_recent_files()
-        self.load_recent_projects()
+        self._recent_file_actions = {}  # path -> QAction, reused across rebuilds
+        self._recent_project_actions = {}
+        # Native settings store; writes are buffered and flushed by Qt
+        self.settings = QSettings("CRTMixer", "CRTMixer")
+        self._load_state()
         self.init_ui()
+        # Widgets behind the "many effects" warning in toggle_live_preview
+        self._effect_checks = (self.noise_check, self.artifact_check, self.crt_check)
+        self._shift_sliders = (self.red_shift, self.green_shift, self.blue_shift)
         self.live_preview_enabled = False
-        self.preview_timer = None
+        # Single-shot debounce: each control change restarts the countdown, so
+        # a slider drag renders once when it settles rather than once per tick.
+        # The interval tracks how long previews take to render (see
+        # _on_preview_finished), so slow images aren't re-rendered faster
+        # than they can finish and quick ones don't wait for nothing.
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MIN_MS)
+        self.preview_timer.timeout.connect(self.auto_preview)
         self.is_processing = False  # Flag to prevent concurrent processing
+        self._preview_pending = False  # Preview requested while a job was running
+        self._job_temp_path = None  # Temp output of the running job, if any
+        # (source, params) of the running preview and of the one on screen
+        self._running_preview = None
+        self._shown_preview = None
+        self._preview_started = None  # perf_counter() when it was submitted
+        self._preview_src_pixels = None  # The preview source, decoded
+        self._preview_pixels = None  # What the preview pixmap was made from
+        self._worker = None
+        # The pipeline runs in a separate process so it never competes with
+        # the GUI for the GIL; a pool thread waits on it and signals back
+        self.process_pool = None
+        self._cancel_event = None  # Created with the process pool
+        # Our own pool, not the global one: Qt's smooth scaling fans out to the
+        # global pool while holding the GIL, so a Python worker parked there
+        # can deadlock against it
+        self.thread_pool = QThreadPool(self)
 
     def init_ui(self):
         self.setWindowTitle("CRT Mixer")
@@ -191,11 +473,10 @@ class PixelSorterApp(QMainWindow):
         header_layout.addStretch()
 
         # Logo on the right
-        logo_path = os.path.join(os.path.dirname(__file__), "logo.svg")
-        if os.path.exists(logo_path):
+        if os.path.exists(LOGO_PATH):
             from PyQt5.QtSvg import QSvgWidget
 
-            svg_widget = QSvgWidget(logo_path)
+            svg_widget = QSvgWidget(LOGO_PATH)
             svg_widget.setFixedSize(100, 40)  # Compact size matching title height
             header_layout.addWidget(svg_widget)
 
@@ -257,8 +538,8 @@ class PixelSorterApp(QMainWindow):
 
         self.threshold_label = QLabel("80")
         self.threshold_label.setStyleSheet("font-weight: bold; min-width: 30px;")
-        self.threshold_slider.valueChanged.connect(
-            lambda v: self.threshold_label.setText(str(v))
+        self._connect_slider_label(
+            self.threshold_slider, lambda v: self.threshold_label.setText(str(v))
         )
         thresh_layout.addWidget(self.threshold_label)
         params_layout.addLayout(thresh_layout)
@@ -326,8 +607,8 @@ class PixelSorterApp(QMainWindow):
 
         self.chroma_label = QLabel("0")
         self.chroma_label.setStyleSheet("font-weight: bold; min-width: 30px;")
-        self.chroma_slider.valueChanged.connect(
-            lambda v: self.chroma_label.setText(str(v))
+        self._connect_slider_label(
+            self.chroma_slider, lambda v: self.chroma_label.setText(str(v))
         )
         chroma_layout.addWidget(self.chroma_label)
         rgb_layout.addLayout(chroma_layout)
@@ -353,8 +634,8 @@ class PixelSorterApp(QMainWindow):
         scanline_layout.addWidget(self.scanline_slider)
         self.scanline_label = QLabel("8")
         self.scanline_label.setStyleSheet("font-weight: bold; min-width: 30px;")
-        self.scanline_slider.valueChanged.connect(
-            lambda v: self.scanline_label.setText(str(v))
+        self._connect_slider_label(
+            self.scanline_slider, lambda v: self.scanline_label.setText(str(v))
         )
         scanline_layout.addWidget(self.scanline_label)
         crt_layout_main.addLayout(scanline_layout)
@@ -369,8 +650,9 @@ class PixelSorterApp(QMainWindow):
         curve_layout.addWidget(self.curvature_slider)
         self.curvature_label = QLabel("0.02")
         self.curvature_label.setStyleSheet("font-weight: bold; min-width: 50px;")
-        self.curvature_slider.valueChanged.connect(
-            lambda v: self.curvature_label.setText(f"{v / 1000:.3f}")
+        self._connect_slider_label(
+            self.curvature_slider,
+            lambda v: self.curvature_label.setText(f"{v / 1000:.3f}"),
         )
         curve_layout.addWidget(self.curvature_label)
         crt_layout_main.addLayout(curve_layout)
@@ -385,8 +667,9 @@ class PixelSorterApp(QMainWindow):
         bright_layout.addWidget(self.crt_brightness_slider)
         self.crt_brightness_label = QLabel("1.2")
         self.crt_brightness_label.setStyleSheet("font-weight: bold; min-width: 50px;")
-        self.crt_brightness_slider.valueChanged.connect(
-            lambda v: self.crt_brightness_label.setText(f"{v / 100:.2f}")
+        self._connect_slider_label(
+            self.crt_brightness_slider,
+            lambda v: self.crt_brightness_label.setText(f"{v / 100:.2f}"),
         )
         bright_layout.addWidget(self.crt_brightness_label)
         crt_layout_main.addLayout(bright_layout)
@@ -401,8 +684,9 @@ class PixelSorterApp(QMainWindow):
         thick_layout.addWidget(self.scanline_thick_slider)
         self.scanline_thick_label = QLabel("1")
         self.scanline_thick_label.setStyleSheet("font-weight: bold; min-width: 30px;")
-        self.scanline_thick_slider.valueChanged.connect(
-            lambda v: self.scanline_thick_label.setText(str(v))
+        self._connect_slider_label(
+            self.scanline_thick_slider,
+            lambda v: self.scanline_thick_label.setText(str(v)),
         )
         thick_layout.addWidget(self.scanline_thick_label)
         crt_layout_main.addLayout(thick_layout)
@@ -417,8 +701,9 @@ class PixelSorterApp(QMainWindow):
         count_layout.addWidget(self.scanline_count_slider)
         self.scanline_count_label = QLabel("600")
         self.scanline_count_label.setStyleSheet("font-weight: bold; min-width: 50px;")
-        self.scanline_count_slider.valueChanged.connect(
-            lambda v: self.scanline_count_label.setText(str(v))
+        self._connect_slider_label(
+            self.scanline_count_slider,
+            lambda v: self.scanline_count_label.setText(str(v)),
         )
         count_layout.addWidget(self.scanline_count_label)
         crt_layout_main.addLayout(count_layout)
@@ -433,8 +718,9 @@ class PixelSorterApp(QMainWindow):
         glow_layout.addWidget(self.phosphor_glow_slider)
         self.phosphor_glow_label = QLabel("0.0")
         self.phosphor_glow_label.setStyleSheet("font-weight: bold; min-width: 50px;")
-        self.phosphor_glow_slider.valueChanged.connect(
-            lambda v: self.phosphor_glow_label.setText(f"{v / 100:.2f}")
+        self._connect_slider_label(
+            self.phosphor_glow_slider,
+            lambda v: self.phosphor_glow_label.setText(f"{v / 100:.2f}"),
         )
         glow_layout.addWidget(self.phosphor_glow_label)
         crt_layout_main.addLayout(glow_layout)
@@ -468,8 +754,9 @@ class PixelSorterApp(QMainWindow):
         intensity_layout.addWidget(self.noise_intensity_slider)
         self.noise_intensity_label = QLabel("0.10")
         self.noise_intensity_label.setStyleSheet("font-weight: bold; min-width: 50px;")
-        self.noise_intensity_slider.valueChanged.connect(
-            lambda v: self.noise_intensity_label.setText(f"{v / 100:.2f}")
+        self._connect_slider_label(
+            self.noise_intensity_slider,
+            lambda v: self.noise_intensity_label.setText(f"{v / 100:.2f}"),
         )
         intensity_layout.addWidget(self.noise_intensity_label)
         noise_layout_main.addLayout(intensity_layout)
@@ -508,8 +795,9 @@ class PixelSorterApp(QMainWindow):
         self.artifact_intensity_label.setStyleSheet(
             "font-weight: bold; min-width: 50px;"
         )
-        self.artifact_intensity_slider.valueChanged.connect(
-            lambda v: self.artifact_intensity_label.setText(f"{v / 100:.2f}")
+        self._connect_slider_label(
+            self.artifact_intensity_slider,
+            lambda v: self.artifact_intensity_label.setText(f"{v / 100:.2f}"),
         )
         artifact_intensity_layout.addWidget(self.artifact_intensity_label)
         artifact_layout_main.addLayout(artifact_intensity_layout)
@@ -521,13 +809,12 @@ class PixelSorterApp(QMainWindow):
         preview_group = QGroupBox("Preview")
         preview_layout = QVBoxLayout()
 
-        self.preview_label = QLabel("Select an image to preview")
-        self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setMinimumSize(600, 400)
-        self.preview_label.setStyleSheet(
+        self.preview_view = PreviewView("Select an image to preview")
+        self.preview_view.setMinimumSize(600, 400)
+        self.preview_view.setStyleSheet(
             "background-color: #f0f0f0; border: 1px solid #ccc;"
         )
-        preview_layout.addWidget(self.preview_label)
+        preview_layout.addWidget(self.preview_view)
 
         preview_group.setLayout(preview_layout)
         main_layout.addWidget(preview_group)
@@ -572,6 +859,16 @@ class PixelSorterApp(QMainWindow):
         self.status_label.setStyleSheet("background-color: #e0e0e0; padding: 8px;")
         outer_layout.addWidget(self.status_label)
 
+    def _connect_slider_label(self, slider, update_label):
+        """Keep a slider's value label in sync without flooding valueChanged.
+
+        With tracking off, valueChanged (and so live preview) fires only once
+        the handle is released; the label follows the drag via sliderMoved.
+        """
+        slider.setTracking(False)
+        slider.valueChanged.connect(update_label)
+        slider.sliderMoved.connect(update_label)
+
     def create_menu_bar(self):
         """Create the menu bar with File menu."""
         menubar = self.menuBar()
@@ -588,7 +885,12 @@ class PixelSorterApp(QMainWindow):
         # Open Recent submenu
         self.recent_menu = QMenu("Open &Recent", self)
         file_menu.addMenu(self.recent_menu)
-        self.update_recent_menu()
+        self.recent_menu.aboutToShow.connect(self.update_recent_menu)
+
+        self.no_recent_files_action = QAction("No Recent Files", self)
+        self.no_recent_files_action.setEnabled(False)
+        self.clear_recent_files_action = QAction("Clear Recent Files", self)
+        self.clear_recent_files_action.triggered.connect(self.clear_recent_files)
 
         file_menu.addSeparator()
 
@@ -607,7 +909,12 @@ class PixelSorterApp(QMainWindow):
         # Load Recent Project submenu
         self.recent_projects_menu = QMenu("Load Recent &Project", self)
         file_menu.addMenu(self.recent_projects_menu)
-        self.update_recent_projects_menu()
+        self.recent_projects_menu.aboutToShow.connect(self.update_recent_projects_menu)
+
+        self.no_recent_projects_action = QAction("No Recent Projects", self)
+        self.no_recent_projects_action.setEnabled(False)
+        self.clear_recent_projects_action = QAction("Clear Recent Projects", self)
+        self.clear_recent_projects_action.triggered.connect(self.clear_recent_projects)
 
         file_menu.addSeparator()
 
@@ -617,30 +924,51 @@ class PixelSorterApp(QMainWindow):
         quit_action.triggered.connect(self.close)
         file_menu.addAction(quit_action)
 
-    def load_recent_files(self):
-        """Load recent files list from a config file."""
-        config_path = os.path.expanduser("~/.crt_mixer_recent")
-        if os.path.exists(config_path):
+    def _load_state(self):
+        """Load the recent files and projects lists from QSettings.
+
+        Existence of the listed paths is only checked when a menu is opened,
+        so startup costs one read no matter how many entries there are.
+        """
+        if not self.settings.contains("recent/files"):
+            self._load_legacy_state()
+            return
+        self.recent_files = self.settings.value("recent/files", [], type=list)
+        self.recent_projects = self.settings.value("recent/projects", [], type=list)
+
+    def _load_legacy_state(self):
+        """Pick up the recent lists written by older versions."""
+        try:
+            state = load_json_file(LEGACY_STATE_PATH)
+            self.recent_files = list(state.get("files", []))
+            self.recent_projects = list(state.get("projects", []))
+            return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading {LEGACY_STATE_PATH}: {e}")
+            return
+
+        for config_path, attr in (
+            (LEGACY_RECENT_FILES_PATH, "recent_files"),
+            (LEGACY_RECENT_PROJECTS_PATH, "recent_projects"),
+        ):
             try:
                 with open(config_path, "r") as f:
-                    self.recent_files = [
-                        line.strip() for line in f.readlines() if line.strip()
-                    ]
-                # Filter out files that no longer exist
-                self.recent_files = [f for f in self.recent_files if os.path.exists(f)]
+                    setattr(self, attr, [line.strip() for line in f if line.strip()])
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                print(f"Error loading recent files: {e}")
-                self.recent_files = []
+                print(f"Error loading {config_path}: {e}")
 
-    def save_recent_files(self):
-        """Save recent files list to a config file."""
-        config_path = os.path.expanduser("~/.crt_mixer_recent")
-        try:
-            with open(config_path, "w") as f:
-                for file_path in self.recent_files[: self.max_recent_files]:
-                    f.write(file_path + "\n")
-        except Exception as e:
-            print(f"Error saving recent files: {e}")
+    def _save_state(self):
+        """Store both recent lists; QSettings writes them out lazily."""
+        self.settings.setValue(
+            "recent/files", self.recent_files[: self.max_recent_files]
+        )
+        self.settings.setValue(
+            "recent/projects", self.recent_projects[: self.max_recent_projects]
+        )
 
     def add_recent_file(self, file_path):
         """Add a file to the recent files list."""
@@ -654,35 +982,77 @@ class PixelSorterApp(QMainWindow):
         # Keep only max_recent_files
         self.recent_files = self.recent_files[: self.max_recent_files]
 
-        # Save and update menu
-        self.save_recent_files()
-        self.update_recent_menu()
+        self._save_state()
 
     def update_recent_menu(self):
-        """Update the Open Recent menu with current recent files."""
+        """Rebuild the Open Recent menu; runs each time the menu is opened."""
         self.recent_menu.clear()
 
-        if not self.recent_files:
-            no_recent_action = QAction("No Recent Files", self)
-            no_recent_action.setEnabled(False)
-            self.recent_menu.addAction(no_recent_action)
-        else:
-            for file_path in self.recent_files:
-                action = QAction(os.path.basename(file_path), self)
-                action.setToolTip(file_path)
-                action.triggered.connect(
-                    lambda checked, path=file_path: self.open_recent_file(path)
-                )
-                self.recent_menu.addAction(action)
+        # Filter out files that no longer exist
+        existing = self._existing_paths(self.recent_files)
+        if existing != self.recent_files:
+            self.recent_files = existing
+            self._save_state()
+
+        self._populate_recent_menu(
+            self.recent_menu,
+            self.recent_files,
+            self._recent_file_actions,
+            self.open_recent_file,
+            self.no_recent_files_action,
+            self.clear_recent_files_action,
+        )
 
-            self.recent_menu.addSeparator()
+    @staticmethod
+    def _existing_paths(paths):
+        """Return the paths that still exist, in order.
 
-            clear_action = QAction("Clear Recent Files", self)
-            clear_action.triggered.connect(self.clear_recent_files)
-            self.recent_menu.addAction(clear_action)
+        Lists each parent directory once with os.scandir instead of stat'ing
+        every path, which is what costs on network drives.
+        """
+        by_dir = {}
+        for path in paths:
+            by_dir.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
 
-    def open_recent_file(self, file_path):
-        """Open a file from the recent files list."""
+        present = set()
+        for directory, names in by_dir.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            present.add(os.path.join(directory, entry.name))
+            except OSError:
+                continue
+
+        # Names can differ only in case on case-insensitive filesystems
+        return [p for p in paths if p in present or os.path.exists(p)]
+
+    def _populate_recent_menu(
+        self, menu, paths, actions, open_slot, empty_action, clear_action
+    ):
+        """Fill a recent menu, reusing the QAction cached for each path."""
+        # Actions are parented to the window, so QMenu.clear() only detaches them
+        for path in set(actions) - set(paths):
+            actions.pop(path).deleteLater()
+
+        if not paths:
+            menu.addAction(empty_action)
+            return
+
+        for path in paths:
+            action = actions.get(path)
+            if action is None:
+                action = QAction(os.path.basename(path), self)
+                action.setToolTip(path)
+                action.triggered.connect(partial(open_slot, path))
+                actions[path] = action
+            menu.addAction(action)
+
+        menu.addSeparator()
+        menu.addAction(clear_action)
+
+    def open_recent_file(self, file_path, checked=False):
+        """Open a file from the recent files list (``checked`` is from triggered)."""
         if os.path.exists(file_path):
             self.load_file(file_path)
         else:
@@ -692,41 +1062,12 @@ class PixelSorterApp(QMainWindow):
             # Remove from recent files
             if file_path in self.recent_files:
                 self.recent_files.remove(file_path)
-                self.save_recent_files()
-                self.update_recent_menu()
+                self._save_state()
 
     def clear_recent_files(self):
         """Clear the recent files list."""
         self.recent_files = []
-        self.save_recent_files()
-        self.update_recent_menu()
-
-    def load_recent_projects(self):
-        """Load recent projects list from a config file."""
-        config_path = os.path.expanduser("~/.crt_mixer_recent_projects")
-        if os.path.exists(config_path):
-            try:
-                with open(config_path, "r") as f:
-                    self.recent_projects = [
-                        line.strip() for line in f.readlines() if line.strip()
-                    ]
-                # Filter out projects that no longer exist
-                self.recent_projects = [
-                    f for f in self.recent_projects if os.path.exists(f)
-                ]
-            except Exception as e:
-                print(f"Error loading recent projects: {e}")
-                self.recent_projects = []
-
-    def save_recent_projects(self):
-        """Save recent projects list to a config file."""
-        config_path = os.path.expanduser("~/.crt_mixer_recent_projects")
-        try:
-            with open(config_path, "w") as f:
-                for project_path in self.recent_projects[: self.max_recent_projects]:
-                    f.write(project_path + "\n")
-        except Exception as e:
-            print(f"Error saving recent projects: {e}")
+        self._save_state()
 
     def add_recent_project(self, project_path):
         """Add a project to the recent projects list."""
@@ -740,34 +1081,28 @@ class PixelSorterApp(QMainWindow):
         # Keep only max_recent_projects
         self.recent_projects = self.recent_projects[: self.max_recent_projects]
 
-        # Save and update menu
-        self.save_recent_projects()
-        self.update_recent_projects_menu()
+        self._save_state()
 
     def update_recent_projects_menu(self):
-        """Update the Load Recent Project menu with current recent projects."""
+        """Rebuild the Load Recent Project menu; runs each time it is opened."""
         self.recent_projects_menu.clear()
 
-        if not self.recent_projects:
-            no_recent_action = QAction("No Recent Projects", self)
-            no_recent_action.setEnabled(False)
-            self.recent_projects_menu.addAction(no_recent_action)
-        else:
-            for project_path in self.recent_projects:
-                action = QAction(os.path.basename(project_path), self)
-                action.setToolTip(project_path)
-                action.triggered.connect(
-                    lambda checked, path=project_path: self.open_recent_project(path)
-                )
-                self.recent_projects_menu.addAction(action)
-
-            self.recent_projects_menu.addSeparator()
-
-            clear_action = QAction("Clear Recent Projects", self)
-            clear_action.triggered.connect(self.clear_recent_projects)
-            self.recent_projects_menu.addAction(clear_action)
+        # Filter out projects that no longer exist
+        existing = self._existing_paths(self.recent_projects)
+        if existing != self.recent_projects:
+            self.recent_projects = existing
+            self._save_state()
+
+        self._populate_recent_menu(
+            self.recent_projects_menu,
+            self.recent_projects,
+            self._recent_project_actions,
+            self.open_recent_project,
+            self.no_recent_projects_action,
+            self.clear_recent_projects_action,
+        )
 
-    def open_recent_project(self, project_path):
+    def open_recent_project(self, project_path, checked=False):
         """Open a project from the recent projects list."""
         if os.path.exists(project_path):
             self.load_project_from_path(project_path)
@@ -780,14 +1115,55 @@ class PixelSorterApp(QMainWindow):
             # Remove from recent projects
             if project_path in self.recent_projects:
                 self.recent_projects.remove(project_path)
-                self.save_recent_projects()
-                self.update_recent_projects_menu()
+                self._save_state()
 
     def clear_recent_projects(self):
         """Clear the recent projects list."""
         self.recent_projects = []
-        self.save_recent_projects()
-        self.update_recent_projects_menu()
+        self._save_state()
+
+    def _collect_params(self):
+        """Snapshot all effect controls into a plain dict.
+
+        The snapshot is taken on the GUI thread so the worker never touches
+        widgets; it doubles as the settings block of a saved project.
+        """
+        return {
+            "sorting": {
+                "mode": self.mode_combo.currentText(),
+                "direction": self.direction_combo.currentText(),
+                "threshold": self.threshold_slider.value(),
+                "reverse": self.reverse_check.isChecked(),
+                "sort_all": self.sort_all_check.isChecked(),
+                "no_sort": self.no_sort_check.isChecked(),
+            },
+            "rgb": {
+                "channel_swap": self.channel_swap_combo.currentText(),
+                "red_shift": self.red_shift.value(),
+                "green_shift": self.green_shift.value(),
+                "blue_shift": self.blue_shift.value(),
+                "chromatic_aberration": self.chroma_slider.value(),
+            },
+            "crt": {
+                "enabled": self.crt_check.isChecked(),
+                "scanline_intensity": self.scanline_slider.value(),
+                "scanline_thickness": self.scanline_thick_slider.value(),
+                "scanline_count": self.scanline_count_slider.value(),
+                "curvature": self.curvature_slider.value(),
+                "brightness": self.crt_brightness_slider.value(),
+                "phosphor_glow": self.phosphor_glow_slider.value(),
+            },
+            "noise": {
+                "enabled": self.noise_check.isChecked(),
+                "type": self.noise_type_combo.currentText(),
+                "intensity": self.noise_intensity_slider.value(),
+            },
+            "artifacting": {
+                "enabled": self.artifact_check.isChecked(),
+                "type": self.artifact_type_combo.currentText(),
+                "intensity": self.artifact_intensity_slider.value(),
+            },
+        }
 
     def save_project(self):
         """Save current project settings to a JSON file."""
@@ -806,44 +1182,14 @@ class PixelSorterApp(QMainWindow):
                 project_data = {
                     "version": "1.0",
                     "input_file": self.input_path,
-                    "sorting": {
-                        "mode": self.mode_combo.currentText(),
-                        "direction": self.direction_combo.currentText(),
-                        "threshold": self.threshold_slider.value(),
-                        "reverse": self.reverse_check.isChecked(),
-                        "sort_all": self.sort_all_check.isChecked(),
-                        "no_sort": self.no_sort_check.isChecked(),
-                    },
-                    "rgb": {
-                        "channel_swap": self.channel_swap_combo.currentText(),
-                        "red_shift": self.red_shift.value(),
-                        "green_shift": self.green_shift.value(),
-                        "blue_shift": self.blue_shift.value(),
-                        "chromatic_aberration": self.chroma_slider.value(),
-                    },
-                    "crt": {
-                        "enabled": self.crt_check.isChecked(),
-                        "scanline_intensity": self.scanline_slider.value(),
-                        "scanline_thickness": self.scanline_thick_slider.value(),
-                        "scanline_count": self.scanline_count_slider.value(),
-                        "curvature": self.curvature_slider.value(),
-                        "brightness": self.crt_brightness_slider.value(),
-                        "phosphor_glow": self.phosphor_glow_slider.value(),
-                    },
-                    "noise": {
-                        "enabled": self.noise_check.isChecked(),
-                        "type": self.noise_type_combo.currentText(),
-                        "intensity": self.noise_intensity_slider.value(),
-                    },
-                    "artifacting": {
-                        "enabled": self.artifact_check.isChecked(),
-                        "type": self.artifact_type_combo.currentText(),
-                        "intensity": self.artifact_intensity_slider.value(),
-                    },
+                    **self._collect_params(),
                 }
 
-                with open(filename, "w") as f:
-                    json.dump(project_data, f, indent=2)
+                # Encode up front: one write, and a failed encode can't leave
+                # a truncated project file behind
+                payload = dump_json(project_data)
+                with open(filename, "wb") as f:
+                    f.write(payload)
 
                 # Add to recent projects
                 self.add_recent_project(filename)
@@ -870,8 +1216,7 @@ class PixelSorterApp(QMainWindow):
     def load_project_from_path(self, filename):
         """Load project settings from a specific file path."""
         try:
-            with open(filename, "r") as f:
-                project_data = json.load(f)
+            project_data = load_json_file(filename)
 
             # Load input file
             if "input_file" in project_data:
@@ -953,16 +1298,9 @@ class PixelSorterApp(QMainWindow):
             QMessageBox.critical(self, "Error", "Cannot read selected file")
             return
 
-        # Validate it's a valid image
+        # Validate it's a valid image: decoding the preview copy reads it all
         try:
-            img = Image.open(filename)
-            img.verify()  # Verify it's a valid image
-            img.close()
-
-            # Reopen to get actual image (verify() closes the file)
-            img = Image.open(filename)
-            width, height = img.size
-            img.close()
+            width, height = self._cache_preview_source(filename)
 
             # Check image size limits (max 8K resolution)
             max_dimension = 8192
@@ -975,10 +1313,12 @@ class PixelSorterApp(QMainWindow):
                 )
 
             self.input_path = filename
-            self.file_label.setText(os.path.basename(filename))
-            self.load_image_preview(filename)
+            self.input_basename = os.path.basename(filename)
+            self.file_label.setText(self.input_basename)
+            self._show_preview_pixels(self._preview_src_pixels)
+            self._shown_preview = None  # Showing the unprocessed image
             self.status_label.setText(
-                f"Image loaded: {os.path.basename(filename)} ({width}x{height})"
+                f"Image loaded: {self.input_basename} ({width}x{height})"
             )
 
             # Add to recent files
@@ -988,6 +1328,68 @@ class PixelSorterApp(QMainWindow):
             QMessageBox.critical(self, "Error", f"Invalid image file: {e}")
             return
 
+    def _cache_preview_source(self, filename):
+        """Decode the input once and keep a preview-sized copy of it.
+
+        Previews start from this copy instead of the original file, so each
+        live-preview tick skips the full-resolution decode and runs every
+        stage on at most PREVIEW_MAX_SIZE pixels. Also shown as the preview
+        until the first render. Returns the input's full size.
+        """
+        with Image.open(filename) as img:
+            size = img.size
+            # JPEGs can decode straight at a fraction of their size
+            img.draft("RGB", self.PREVIEW_MAX_SIZE)
+            preview_src = img.convert("RGB")
+        preview_src.thumbnail(self.PREVIEW_MAX_SIZE, Image.Resampling.LANCZOS)
+        self._preview_scale = preview_src.width / size[0]
+        self._preview_src_pixels = np.array(preview_src)
+
+        # Write through the descriptor mkstemp opened rather than reopening
+        fd, temp_path = tempfile.mkstemp(suffix=".png")
+        with os.fdopen(fd, "wb") as f:
+            preview_src.save(f, format="PNG", compress_level=1)
+
+        self._discard_preview_source()
+        self._preview_src_path = temp_path
+        return size
+
+    def _discard_preview_source(self):
+        """Delete the cached preview source of the previous input, if any."""
+        if self._preview_src_path:
+            remove_file_quietly(self._preview_src_path)
+        self._preview_src_path = None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.process_pool is None:
+            # Start the effects process and load its modules once the window is up
+            self._get_process_pool().submit(import_effects)
+
+    def closeEvent(self, event):
+        """Clean up the cached preview source when the app closes."""
+        self._discard_preview_source()
+        self.settings.sync()
+        if self.process_pool is not None:
+            self._cancel_event.set()
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+        event.accept()
+
+    def _get_process_pool(self):
+        """Return the effects process pool, creating it on first use."""
+        if self.process_pool is None:
+            # Jobs are serialized by is_processing, so one process is enough.
+            # spawn rather than fork: forking a process running Qt is unsafe.
+            context = multiprocessing.get_context("spawn")
+            self._cancel_event = context.Event()
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=init_worker,
+                initargs=(self._cancel_event,),
+            )
+        return self.process_pool
+
     def select_file(self):
         filename, _ = QFileDialog.getOpenFileName(
             self,
@@ -999,188 +1401,8 @@ class PixelSorterApp(QMainWindow):
         if filename:
             self.load_file(filename)
 
-    def load_image_preview(self, path):
-        try:
-            pixmap = QPixmap(path)
-            scaled_pixmap = pixmap.scaled(
-                600, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            self.preview_label.setPixmap(scaled_pixmap)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load image: {e}")
-
-    def apply_effects(self, input_path, output_path, is_preview=False):
-        """Apply all selected effects in order."""
-        import tempfile
-
-        current_path = input_path
-        temp_files = []
-
-        try:
-            print(f"[DEBUG] Starting apply_effects with input: {input_path}")
-            # Step 1: Noise Overlay (applied first)
-            if self.noise_check.isChecked():
-                temp0 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp0.close()
-                temp_files.append(temp0.name)
-
-                noise_type_map = {
-                    "Gaussian": "gaussian",
-                    "Film Grain": "film_grain",
-                    "Salt & Pepper": "salt_pepper",
-                }
-                noise_type = noise_type_map.get(
-                    self.noise_type_combo.currentText(), "gaussian"
-                )
-
-                apply_noise_overlay(
-                    current_path,
-                    temp0.name,
-                    intensity=self.noise_intensity_slider.value() / 100,
-                    noise_type=noise_type,
-                )
-                current_path = temp0.name
-
-            # Step 2: Artifacting
-            if self.artifact_check.isChecked():
-                temp_art = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp_art.close()
-                temp_files.append(temp_art.name)
-
-                artifact_type_map = {
-                    "JPEG Compression": "jpeg",
-                    "VHS Tracking": "vhs",
-                    "Digital Glitch": "digital_glitch",
-                    "Color Bleed": "color_bleed",
-                }
-                artifact_type = artifact_type_map.get(
-                    self.artifact_type_combo.currentText(), "jpeg"
-                )
-
-                apply_artifacting(
-                    current_path,
-                    temp_art.name,
-                    intensity=self.artifact_intensity_slider.value() / 100,
-                    artifact_type=artifact_type,
-                )
-                current_path = temp_art.name
-
-            # Step 3: Channel swap
-            swap_mode = self.channel_swap_combo.currentText()
-            if swap_mode != "None":
-                temp1 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp1.close()
-                temp_files.append(temp1.name)
-
-                swap_map = {
-                    "RGB→RBG": "rbg",
-                    "RGB→GRB": "grb",
-                    "RGB→GBR": "gbr",
-                    "RGB→BRG": "brg",
-                    "RGB→BGR": "bgr",
-                }
-                apply_channel_swap(current_path, temp1.name, swap_map[swap_mode])
-                current_path = temp1.name
-
-            # Step 4: RGB Shift
-            if (
-                self.red_shift.value() != 0
-                or self.green_shift.value() != 0
-                or self.blue_shift.value() != 0
-            ):
-                temp2 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp2.close()
-                temp_files.append(temp2.name)
-
-                apply_rgb_shift(
-                    current_path,
-                    temp2.name,
-                    red_x=self.red_shift.value(),
-                    green_x=self.green_shift.value(),
-                    blue_x=self.blue_shift.value(),
-                )
-                current_path = temp2.name
-
-            # Step 5: Chromatic Aberration
-            if self.chroma_slider.value() > 0:
-                temp3 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp3.close()
-                temp_files.append(temp3.name)
-
-                apply_chromatic_aberration(
-                    current_path, temp3.name, self.chroma_slider.value()
-                )
-                current_path = temp3.name
-
-            # Step 6: Pixel sorting
-            # Skip sorting if "No Sort" is checked
-            if not self.no_sort_check.isChecked():
-                temp4 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp4.close()
-                temp_files.append(temp4.name)
-
-                if self.sort_all_check.isChecked():
-                    sort_all_pixels(
-                        current_path,
-                        temp4.name,
-                        self.mode_combo.currentText(),
-                        self.reverse_check.isChecked(),
-                    )
-                else:
-                    sort_pixels_parallel(
-                        current_path,
-                        temp4.name,
-                        self.mode_combo.currentText(),
-                        self.direction_combo.currentText(),
-                        self.threshold_slider.value(),
-                        self.reverse_check.isChecked(),
-                        preview_mode=is_preview,
-                    )
-                current_path = temp4.name
-
-            # Step 7: CRT Filter
-            if self.crt_check.isChecked():
-                temp5 = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-                temp5.close()
-                temp_files.append(temp5.name)
-
-                apply_crt_filter(
-                    current_path,
-                    temp5.name,
-                    hard_scan=-self.scanline_slider.value(),
-                    display_warp_x=self.curvature_slider.value() / 1000,
-                    display_warp_y=self.curvature_slider.value() / 1000,
-                    brightness=self.crt_brightness_slider.value() / 100,
-                    scanline_intensity=self.scanline_slider.value() / 100,
-                    scanline_thickness=self.scanline_thick_slider.value(),
-                    scanline_count=self.scanline_count_slider.value(),
-                    phosphor_glow=self.phosphor_glow_slider.value() / 100,
-                )
-                current_path = temp5.name
-
-            # Copy final result to output
-            import shutil
-
-            shutil.copy(current_path, output_path)
-
-        finally:
-            # Clean up temp files
-            for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    try:
-                        os.unlink(temp_file)
-                    except (OSError, PermissionError) as e:
-                        print(f"Warning: Could not delete temp file {temp_file}: {e}")
-
-            # Force garbage collection to free memory
-            import gc
-
-            gc.collect()
-
     def toggle_live_preview(self, state):
         """Enable or disable live preview mode."""
-        from PyQt5.QtCore import QTimer
-
         self.live_preview_enabled = state == Qt.Checked
 
         if self.live_preview_enabled:
@@ -1192,22 +1414,12 @@ class PixelSorterApp(QMainWindow):
                 return
 
             # Warn about performance with many effects
-            effects_count = sum(
-                [
-                    self.noise_check.isChecked(),
-                    self.artifact_check.isChecked(),
-                    self.crt_check.isChecked(),
-                    not self.no_sort_check.isChecked(),
-                    self.channel_swap_combo.currentText() != "None",
-                    any(
-                        [
-                            self.red_shift.value(),
-                            self.green_shift.value(),
-                            self.blue_shift.value(),
-                        ]
-                    ),
-                    self.chroma_slider.value() > 0,
-                ]
+            effects_count = (
+                sum(check.isChecked() for check in self._effect_checks)
+                + (not self.no_sort_check.isChecked())
+                + (self.channel_swap_combo.currentIndex() != 0)  # 0 is "None"
+                + any(slider.value() for slider in self._shift_sliders)
+                + (self.chroma_slider.value() > 0)
             )
 
             if effects_count >= 3:
@@ -1218,11 +1430,6 @@ class PixelSorterApp(QMainWindow):
                     "Tip: Disable some effects or use the Preview button instead for better performance.",
                 )
 
-            # Create timer for debounced updates
-            if self.preview_timer is None:
-                self.preview_timer = QTimer()
-                self.preview_timer.timeout.connect(self.auto_preview)
-
             # Connect all controls to trigger preview update
             self.connect_live_preview_signals()
 
@@ -1231,155 +1438,148 @@ class PixelSorterApp(QMainWindow):
             self.status_label.setText("Live preview enabled")
         else:
             # Disconnect signals
-            if self.preview_timer:
-                self.preview_timer.stop()
+            self.preview_timer.stop()
             self.disconnect_live_preview_signals()
             self.status_label.setText("Live preview disabled")
 
+    def _live_preview_signals(self):
+        """Yield the control signals that trigger a live preview update."""
+        for attr, signal in self.LIVE_PREVIEW_SIGNALS:
+            yield getattr(getattr(self, attr), signal)
+
     def connect_live_preview_signals(self):
         """Connect all control signals to trigger preview updates."""
-        # Sorting controls
-        self.mode_combo.currentIndexChanged.connect(self.schedule_preview_update)
-        self.direction_combo.currentIndexChanged.connect(self.schedule_preview_update)
-        self.threshold_slider.valueChanged.connect(self.schedule_preview_update)
-        self.reverse_check.stateChanged.connect(self.schedule_preview_update)
-        self.sort_all_check.stateChanged.connect(self.schedule_preview_update)
-        self.no_sort_check.stateChanged.connect(self.schedule_preview_update)
-
-        # RGB controls
-        self.channel_swap_combo.currentIndexChanged.connect(
-            self.schedule_preview_update
-        )
-        self.red_shift.valueChanged.connect(self.schedule_preview_update)
-        self.green_shift.valueChanged.connect(self.schedule_preview_update)
-        self.blue_shift.valueChanged.connect(self.schedule_preview_update)
-        self.chroma_slider.valueChanged.connect(self.schedule_preview_update)
-
-        # CRT controls
-        self.crt_check.stateChanged.connect(self.schedule_preview_update)
-        self.scanline_slider.valueChanged.connect(self.schedule_preview_update)
-        self.scanline_thick_slider.valueChanged.connect(self.schedule_preview_update)
-        self.scanline_count_slider.valueChanged.connect(self.schedule_preview_update)
-        self.curvature_slider.valueChanged.connect(self.schedule_preview_update)
-        self.crt_brightness_slider.valueChanged.connect(self.schedule_preview_update)
-        self.phosphor_glow_slider.valueChanged.connect(self.schedule_preview_update)
-
-        # Noise controls
-        self.noise_check.stateChanged.connect(self.schedule_preview_update)
-        self.noise_type_combo.currentIndexChanged.connect(self.schedule_preview_update)
-        self.noise_intensity_slider.valueChanged.connect(self.schedule_preview_update)
-
-        # Artifacting controls
-        self.artifact_check.stateChanged.connect(self.schedule_preview_update)
-        self.artifact_type_combo.currentIndexChanged.connect(
-            self.schedule_preview_update
-        )
-        self.artifact_intensity_slider.valueChanged.connect(
-            self.schedule_preview_update
-        )
+        for signal in self._live_preview_signals():
+            signal.connect(self.schedule_preview_update)
 
     def disconnect_live_preview_signals(self):
         """Disconnect all control signals."""
-        signals = [
-            # Sorting controls
-            (self.mode_combo.currentIndexChanged, self.schedule_preview_update),
-            (self.direction_combo.currentIndexChanged, self.schedule_preview_update),
-            (self.threshold_slider.valueChanged, self.schedule_preview_update),
-            (self.reverse_check.stateChanged, self.schedule_preview_update),
-            (self.sort_all_check.stateChanged, self.schedule_preview_update),
-            (self.no_sort_check.stateChanged, self.schedule_preview_update),
-            # RGB controls
-            (self.channel_swap_combo.currentIndexChanged, self.schedule_preview_update),
-            (self.red_shift.valueChanged, self.schedule_preview_update),
-            (self.green_shift.valueChanged, self.schedule_preview_update),
-            (self.blue_shift.valueChanged, self.schedule_preview_update),
-            (self.chroma_slider.valueChanged, self.schedule_preview_update),
-            # CRT controls
-            (self.crt_check.stateChanged, self.schedule_preview_update),
-            (self.scanline_slider.valueChanged, self.schedule_preview_update),
-            (self.scanline_thick_slider.valueChanged, self.schedule_preview_update),
-            (self.scanline_count_slider.valueChanged, self.schedule_preview_update),
-            (self.curvature_slider.valueChanged, self.schedule_preview_update),
-            (self.crt_brightness_slider.valueChanged, self.schedule_preview_update),
-            (self.phosphor_glow_slider.valueChanged, self.schedule_preview_update),
-            # Noise controls
-            (self.noise_check.stateChanged, self.schedule_preview_update),
-            (self.noise_type_combo.currentIndexChanged, self.schedule_preview_update),
-            (self.noise_intensity_slider.valueChanged, self.schedule_preview_update),
-            # Artifacting controls
-            (self.artifact_check.stateChanged, self.schedule_preview_update),
-            (
-                self.artifact_type_combo.currentIndexChanged,
-                self.schedule_preview_update,
-            ),
-            (self.artifact_intensity_slider.valueChanged, self.schedule_preview_update),
-        ]
-
-        # Disconnect each signal individually
-        for signal, slot in signals:
+        for signal in self._live_preview_signals():
             try:
-                signal.disconnect(slot)
+                signal.disconnect(self.schedule_preview_update)
             except (TypeError, RuntimeError):
                 # Signal not connected or already disconnected
                 pass
 
     def schedule_preview_update(self):
-        """Schedule a preview update after a short delay (debouncing)."""
-        if self.live_preview_enabled and self.preview_timer:
-            # Restart timer - waits 1000ms after last change (increased for stability)
-            self.preview_timer.stop()
-            self.preview_timer.start(1000)  # 1000ms delay
+        """Schedule a preview update once the controls settle (debouncing)."""
+        if self.live_preview_enabled:
+            # start() restarts the countdown if it is already running
+            self.preview_timer.start()
 
     def auto_preview(self):
         """Automatically update preview (called by timer)."""
-        if self.preview_timer:
-            self.preview_timer.stop()
+        # The controls may have come back to where they were (a slider dragged
+        # back, a checkbox toggled twice). If that is what the running preview
+        # renders, or what is on screen with no preview running, there is
+        # nothing to redo, and any re-render queued in between is moot.
+        preview = (self._preview_src_path, self._collect_params())
+        if preview == self._running_preview or (
+            self._running_preview is None and preview == self._shown_preview
+        ):
+            self._preview_pending = False
+            return
+        # preview_sort coalesces with any job that is still running
+        self.preview_sort()
 
-        # Only start preview if not already processing
-        if not self.is_processing:
+    def _start_worker(self, on_finished, *args, **kwargs):
+        """Run apply_effects in the effects process; on_finished gets its result."""
+        self.is_processing = True
+        if self._cancel_event is not None:
+            self._cancel_event.clear()
+        try:
+            future = self._get_process_pool().submit(apply_effects, *args, **kwargs)
+        except BrokenProcessPool:
+            # The effects process died (e.g. ran out of memory); start a new one
+            self.process_pool = None
+            future = self._get_process_pool().submit(apply_effects, *args, **kwargs)
+        worker = EffectsWorker(future.result)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(self._on_worker_error)
+        # Keep a reference so the signals object outlives the queued emit
+        self._worker = worker
+        self.thread_pool.start(worker)
+
+    def _job_done(self):
+        """Mark the current job finished and run any preview queued meanwhile."""
+        self.is_processing = False
+        self._job_temp_path = None
+        self._running_preview = None
+        self._worker = None
+        if self._preview_pending:
+            self._preview_pending = False
             self.preview_sort()
 
+    def _on_worker_error(self, error):
+        if self._job_temp_path:
+            remove_file_quietly(self._job_temp_path)
+        QMessageBox.critical(
+            self, "Error", f"Processing failed: {error}\n\nCheck console for details."
+        )
+        self.status_label.setText("Error occurred")
+        self._job_done()
+
     def preview_sort(self):
         if not self.input_path:
             QMessageBox.warning(self, "No File", "Please select an input file first")
             return
 
-        # Prevent concurrent processing
+        # Don't run concurrently; re-render once the running job is done
         if self.is_processing:
+            if self._running_preview is not None:
+                # A preview is out of date as soon as another is asked for:
+                # have the effects process drop it at the next stage
+                self._cancel_event.set()
+                self._running_preview = None
+            self._preview_pending = True
             self.status_label.setText("Processing in progress, please wait...")
             return
 
-        self.is_processing = True
-        self.status_label.setText("Processing preview...")
-        QApplication.processEvents()
-
-        try:
-            import tempfile
-            import traceback
+        params = self._collect_params()
+        if not has_effects(params):
+            # Nothing to apply: the preview source is the preview
+            self._show_preview_pixels(self._preview_src_pixels)
+            self._shown_preview = (self._preview_src_path, params)
+            self.status_label.setText("Preview complete")
+            return
 
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-            temp_path = temp_file.name
-            temp_file.close()
+        self.status_label.setText("Processing preview...")
 
-            print(f"[DEBUG] Preview: temp file = {temp_path}")
-            self.apply_effects(self.input_path, temp_path, is_preview=True)
+        self._running_preview = (self._preview_src_path, params)
+        self._preview_started = time.perf_counter()
+        # No output path: the worker sends back the pixels themselves
+        self._start_worker(
+            self._on_preview_finished,
+            self._preview_src_path,
+            None,
+            params,
+            is_preview=True,
+            preview_scale=self._preview_scale,
+        )
 
-            # Load preview
-            self.load_image_preview(temp_path)
-            os.unlink(temp_path)
+    def _on_preview_finished(self, pixels):
+        # A newer preview was requested mid-run: drop this stale result (None
+        # if the effects process got to cancel it)
+        if pixels is not None:
+            # Only completed renders say how long one takes; cancelled ones
+            # stop early
+            elapsed_ms = (time.perf_counter() - self._preview_started) * 1000
+            self.preview_timer.setInterval(
+                min(
+                    max(self.PREVIEW_DEBOUNCE_MIN_MS, int(elapsed_ms * 0.9)),
+                    self.PREVIEW_DEBOUNCE_MAX_MS,
+                )
+            )
+        if pixels is not None and not self._preview_pending:
+            self._show_preview_pixels(pixels)
+            self._shown_preview = self._running_preview
             self.status_label.setText("Preview complete")
+        self._job_done()
 
-        except Exception as e:
-            import traceback
-
-            error_details = traceback.format_exc()
-            print(f"[ERROR] Preview failed: {error_details}")
-            QMessageBox.critical(
-                self, "Error", f"Processing failed: {e}\n\nCheck console for details."
-            )
-            self.status_label.setText("Error occurred")
-        finally:
-            self.is_processing = False
+    def _show_preview_pixels(self, pixels):
+        # Keep the buffer alive for as long as the pixmap may share it
+        self._preview_pixels = pixels
+        self.preview_view.set_pixmap(pixmap_from_array(pixels))
 
     def fullres_preview(self):
         """Open full resolution preview in separate window."""
@@ -1392,30 +1592,30 @@ class PixelSorterApp(QMainWindow):
             QMessageBox.warning(self, "Busy", "Processing in progress, please wait...")
             return
 
-        self.is_processing = True
         self.status_label.setText("Processing full resolution preview...")
-        QApplication.processEvents()
 
-        try:
-            import tempfile
-
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".jpg")
-            temp_path = temp_file.name
-            temp_file.close()
-
-            self.apply_effects(self.input_path, temp_path, is_preview=False)
-
-            # Open in separate preview window
-            self.preview_window = FullResPreviewWindow(temp_path, self)
-            self.preview_window.show()
+        # Uncompressed BMP: lossless, so 100% zoom shows the exact result, and
+        # far quicker to write and read back than a JPEG of the same image
+        fd, temp_path = tempfile.mkstemp(suffix=".bmp")
+        os.close(fd)  # The effects process writes it
+
+        self._job_temp_path = temp_path
+        self._start_worker(
+            self._on_fullres_finished,
+            self.input_path,
+            temp_path,
+            self._collect_params(),
+            is_preview=False,
+        )
 
-            self.status_label.setText("✓ Full resolution preview opened in new window")
+    def _on_fullres_finished(self, temp_path):
+        # Open in separate preview window (it deletes the temp file on close)
+        self.preview_window = FullResPreviewWindow(temp_path, self)
+        self.preview_window.show()
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Processing failed: {e}")
-            self.status_label.setText("Error occurred")
-        finally:
-            self.is_processing = False
+        self.status_label.setText("✓ Full resolution preview opened in new window")
+        self._job_temp_path = None
+        self._job_done()
 
     def save_sorted(self):
         if not self.input_path:
@@ -1440,26 +1640,25 @@ class PixelSorterApp(QMainWindow):
         )
 
         if output_path:
-            self.is_processing = True
             self.status_label.setText("Processing...")
-            QApplication.processEvents()
 
-            try:
-                self.apply_effects(self.input_path, output_path, is_preview=False)
-
-                self.status_label.setText(f"✓ Saved to {os.path.basename(output_path)}")
-                QMessageBox.information(
-                    self, "Success", f"File saved to:\n{output_path}"
-                )
+            self._start_worker(
+                self._on_save_finished,
+                self.input_path,
+                output_path,
+                self._collect_params(),
+                is_preview=False,
+            )
 
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Processing failed: {e}")
-                self.status_label.setText("Error occurred")
-            finally:
-                self.is_processing = False
+    def _on_save_finished(self, output_path):
+        self.status_label.setText(f"✓ Saved to {os.path.basename(output_path)}")
+        self._job_done()
+        QMessageBox.information(self, "Success", f"File saved to:\n{output_path}")
 
 
 def main():
+    # Lets the effects process start from a PyInstaller build
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = PixelSorterApp()
     window.show()
@@ -5,6 +5,10 @@ import io
 import numpy as np
 from PIL import Image, ImageFilter
 
+# Random source for the VHS and glitch effects. Each effect draws what it
+# needs as whole arrays up front rather than a call per block or line.
+_rng = np.random.default_rng()
+
 
 def apply_artifacting(input_path, output_path, intensity=0.5, artifact_type="jpeg"):
     """
@@ -22,16 +26,7 @@ def apply_artifacting(input_path, output_path, intensity=0.5, artifact_type="jpe
     if img.mode in ("RGBA", "LA", "P"):
         img = img.convert("RGB")
 
-    if artifact_type == "jpeg":
-        result = apply_jpeg_artifacts(img, intensity)
-    elif artifact_type == "vhs":
-        result = apply_vhs_artifacts(img, intensity)
-    elif artifact_type == "digital_glitch":
-        result = apply_digital_glitch(img, intensity)
-    elif artifact_type == "color_bleed":
-        result = apply_color_bleed(img, intensity)
-    else:
-        result = img
+    result = artifact_image(img, intensity, artifact_type)
 
     # Save result
     try:
@@ -42,6 +37,39 @@ def apply_artifacting(input_path, output_path, intensity=0.5, artifact_type="jpe
         result.save(output_path_png)
 
 
+def apply_artifacting_array(pixels, intensity=0.5, artifact_type="jpeg"):
+    """
+    Apply an artifacting effect to an RGB image array.
+
+    Args:
+        pixels: uint8 RGB image array (H x W x 3)
+        intensity: Artifact intensity (0.0 to 1.0)
+        artifact_type: Type of artifacts ('jpeg', 'vhs', 'digital_glitch', 'color_bleed')
+
+    Returns:
+        New uint8 RGB array (read-only)
+    """
+    result = artifact_image(Image.fromarray(pixels), intensity, artifact_type)
+    # convert() copies even an RGB image, and np.array() would copy the
+    # image's bytes again; asarray makes the one copy, read-only
+    if result.mode != "RGB":
+        result = result.convert("RGB")
+    return np.asarray(result)
+
+
+def artifact_image(img, intensity, artifact_type):
+    """Dispatch to the artifact effect for artifact_type; returns a PIL Image."""
+    if artifact_type == "jpeg":
+        return apply_jpeg_artifacts(img, intensity)
+    elif artifact_type == "vhs":
+        return apply_vhs_artifacts(img, intensity)
+    elif artifact_type == "digital_glitch":
+        return apply_digital_glitch(img, intensity)
+    elif artifact_type == "color_bleed":
+        return apply_color_bleed(img, intensity)
+    return img
+
+
 def apply_jpeg_artifacts(img, intensity):
     """Apply JPEG compression artifacts."""
     # Lower quality = more artifacts
@@ -65,20 +93,25 @@ def apply_vhs_artifacts(img, intensity):
     # Horizontal tracking lines (random displacement)
     if intensity > 0.1:
         num_lines = int(intensity * 30)
-        for _ in range(num_lines):
-            y = np.random.randint(0, height)
-            line_height = np.random.randint(1, int(5 * intensity) + 1)
-            shift = int(np.random.randint(-20, 20) * intensity)
-
+        ys = _rng.integers(0, height, num_lines)
+        # At least one row high, also below intensity 0.2 (int(5 * intensity) == 0)
+        line_heights = _rng.integers(1, max(1, int(5 * intensity)) + 1, num_lines)
+        shifts = (_rng.integers(-20, 20, num_lines) * intensity).astype(int)
+        for y, line_height, shift in zip(
+            ys.tolist(), line_heights.tolist(), shifts.tolist()
+        ):
             if y + line_height < height:
-                line = img_array[y : y + line_height, :].copy()
-                img_array[y : y + line_height, :] = 0
-
-                # Shift the line
+                # Shift the lines in place (NumPy handles the overlap) and
+                # blank what they uncover; a zero shift blanks them entirely
+                lines = img_array[y : y + line_height]
                 if shift > 0 and shift < width:
-                    img_array[y : y + line_height, shift:] = line[:, :-shift]
+                    lines[:, shift:] = lines[:, :-shift]
+                    lines[:, :shift] = 0
                 elif shift < 0 and abs(shift) < width:
-                    img_array[y : y + line_height, :shift] = line[:, abs(shift) :]
+                    lines[:, :shift] = lines[:, abs(shift) :]
+                    lines[:, shift:] = 0
+                else:
+                    lines[:] = 0
 
     # Color channel separation (VHS color bleeding)
     if intensity > 0.2 and len(img_array.shape) == 3:
@@ -91,8 +124,10 @@ def apply_vhs_artifacts(img, intensity):
 
     # Add some noise to VHS effect
     if intensity > 0.3:
-        noise = np.random.normal(0, intensity * 10, img_array.shape)
-        img_array = img_array + noise
+        # float32 noise, added in place
+        noise = _rng.standard_normal(img_array.shape, dtype=np.float32)
+        noise *= intensity * 10
+        img_array += noise
 
     img_array = np.clip(img_array, 0, 255).astype(np.uint8)
     return Image.fromarray(img_array, mode="RGB")
@@ -105,15 +140,23 @@ def apply_digital_glitch(img, intensity):
 
     # Block corruption (like corrupted video frames)
     num_blocks = int(intensity * 50)
-    for _ in range(num_blocks):
-        block_w = np.random.randint(8, int(80 * intensity) + 8)
-        block_h = np.random.randint(8, int(60 * intensity) + 8)
-        x = np.random.randint(0, max(1, width - block_w))
-        y = np.random.randint(0, max(1, height - block_h))
-
-        # Random corruption type
-        corruption = np.random.choice(["repeat", "shift", "zero", "noise"])
-
+    block_ws = _rng.integers(8, int(80 * intensity) + 8, num_blocks)
+    block_hs = _rng.integers(8, int(60 * intensity) + 8, num_blocks)
+    xs = _rng.integers(0, np.maximum(1, width - block_ws))
+    ys = _rng.integers(0, np.maximum(1, height - block_hs))
+    # Random corruption type
+    corruptions = _rng.choice(["repeat", "shift", "zero", "noise"], num_blocks)
+    # Only used by "shift" blocks, but drawn for all of them in one go
+    shifts = _rng.integers(-block_ws // 2, block_ws // 2)
+
+    for block_w, block_h, x, y, corruption, shift in zip(
+        block_ws.tolist(),
+        block_hs.tolist(),
+        xs.tolist(),
+        ys.tolist(),
+        corruptions.tolist(),
+        shifts.tolist(),
+    ):
         if corruption == "repeat" and x > 0:
             # Repeat previous block (ensure dimensions match)
             prev_x_start = max(0, x - block_w)
@@ -126,7 +169,6 @@ def apply_digital_glitch(img, intensity):
                 img_array[y : y + block_h, x : x + block_w] = 0
         elif corruption == "shift":
             # Shift block data
-            shift = np.random.randint(-block_w // 2, block_w // 2)
             if abs(shift) > 0:
                 img_array[y : y + block_h, x : x + block_w] = np.roll(
                     img_array[y : y + block_h, x : x + block_w], shift, axis=1
@@ -135,19 +177,19 @@ def apply_digital_glitch(img, intensity):
             # Black blocks
             img_array[y : y + block_h, x : x + block_w] = 0
         elif corruption == "noise":
-            # Random noise blocks
-            img_array[y : y + block_h, x : x + block_w] = np.random.randint(
-                0, 256, (block_h, block_w, img_array.shape[2]), dtype=np.uint8
-            )
+            # Random noise blocks (sized to the block as clipped by the image)
+            block = img_array[y : y + block_h, x : x + block_w]
+            block[...] = _rng.integers(0, 256, block.shape, dtype=np.uint8)
 
     # Horizontal line displacement (datamoshing effect)
     if intensity > 0.5:
         num_displaced = int(intensity * 20)
-        for _ in range(num_displaced):
-            y = np.random.randint(0, height - 1)
-            line_height = np.random.randint(1, 5)
-            shift = np.random.randint(-width // 4, width // 4)
-
+        ys = _rng.integers(0, height - 1, num_displaced)
+        line_heights = _rng.integers(1, 5, num_displaced)
+        shifts = _rng.integers(-width // 4, width // 4, num_displaced)
+        for y, line_height, shift in zip(
+            ys.tolist(), line_heights.tolist(), shifts.tolist()
+        ):
             if y + line_height < height:
                 img_array[y : y + line_height, :] = np.roll(
                     img_array[y : y + line_height, :], shift, axis=1
@@ -0,0 +1,315 @@
+"""
+The effects pipeline behind the CRT Mixer GUI.
+
+Kept out of CRT_Mixer.py so it can run in a worker process without
+importing Qt.
+"""
+
+import os
+import shutil
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+# Intermediate preview results, keyed by everything that produced them (see
+# apply_effects). Lives in the worker process across jobs; least recently
+# used entries are dropped past STAGE_CACHE_SIZE.
+STAGE_CACHE_SIZE = 8
+_stage_cache = OrderedDict()
+
+# (key, pixels) of the last decoded preview source. Kept apart from
+# _stage_cache so the stages' results can never push it out.
+_source_cache = None
+
+# Set by the GUI to abandon the running preview (see init_worker)
+_cancel_event = None
+
+
+def init_worker(cancel_event):
+    """Process pool initializer: keep the event that cancels previews.
+
+    A multiprocessing Event can only reach a worker when the process is
+    created, not through submit(), hence the initializer.
+    """
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def import_effects():
+    """Import the effect modules that apply_effects uses and warm them up.
+
+    They pull in SciPy and Numba, so they are only imported by the process
+    that runs the pipeline, never by the GUI itself.
+    """
+    import artifacting  # noqa: F401
+    import crt_filter  # noqa: F401
+    import noise_overlay  # noqa: F401
+    import pixel_sorter_parallel  # noqa: F401
+    import rgb_distortion  # noqa: F401
+
+    _warm_up_kernels()
+
+
+def _warm_up_kernels():
+    """Run each Numba kernel once on a tiny image.
+
+    The first call of a kernel compiles it (or loads it from Numba's disk
+    cache) and starts the threading layer, which would otherwise hold up the
+    first preview. The argument types match what apply_effects passes, so
+    the compiled signatures are the ones it uses.
+    """
+    from crt_filter import apply_display_warp, apply_shadow_mask
+    from pixel_sorter_parallel import sort_pixels_parallel_array
+    from rgb_distortion import apply_rgb_shift_array
+
+    pixels = np.zeros((4, 4, 3), dtype=np.uint8)
+    apply_rgb_shift_array(pixels, red_x=1, aberration=1.0)
+    # Brightness and the channel modes share one kernel, hue and saturation
+    # use another; vertical sorting passes them a transposed (strided) view
+    for direction in ("horizontal", "vertical"):
+        sort_pixels_parallel_array(pixels, "brightness", direction, 100)
+        sort_pixels_parallel_array(pixels, "hue", direction, 100)
+    apply_display_warp(pixels.astype(np.float32), 0.01, 0.01)
+    apply_shadow_mask(pixels.astype(np.float32), 0.9, 1.05, 3)
+
+
+def has_effects(params):
+    """Whether params (as for apply_effects) turn on any effect at all."""
+    rgb = params["rgb"]
+    return (
+        params["noise"]["enabled"]
+        or params["artifacting"]["enabled"]
+        or rgb["channel_swap"] != "None"
+        or rgb["red_shift"] != 0
+        or rgb["green_shift"] != 0
+        or rgb["blue_shift"] != 0
+        or rgb["chromatic_aberration"] > 0
+        or not params["sorting"]["no_sort"]
+        or params["crt"]["enabled"]
+    )
+
+
+def apply_effects(input_path, output_path, params, is_preview=False, preview_scale=1.0):
+    """Apply all selected effects in order.
+
+    ``params`` is the dict built by ``PixelSorterApp._collect_params``. This
+    runs in a separate process, so everything it needs must come in through
+    the arguments. The image is decoded once, passed between the effects as
+    a NumPy array and encoded once at the end. With no ``output_path`` the
+    uint8 RGB array itself is returned instead of being encoded.
+
+    Previews keep each stage's result in ``_stage_cache`` under a key that
+    chains the stage's arguments onto the key of its input, so a change to a
+    late stage (say the CRT glow) starts from the cached output of the stage
+    before it instead of rerunning the whole pipeline. A preview is abandoned
+    between stages, returning None, once the cancel event is set.
+
+    For previews, ``input_path`` is already a downsampled copy of the input
+    and ``preview_scale`` its size relative to the original; the effects that
+    are measured in pixels are scaled by it so the preview matches the
+    full-size result.
+    """
+    from artifacting import apply_artifacting_array
+    from crt_filter import apply_crt_filter_array
+    from noise_overlay import apply_noise_overlay_array
+    from pixel_sorter_parallel import sort_all_pixels_array, sort_pixels_parallel_array
+    from rgb_distortion import apply_channel_swap_array, apply_rgb_shift_array
+
+    scale = preview_scale if is_preview else 1.0
+    sorting = params["sorting"]
+    rgb = params["rgb"]
+    crt = params["crt"]
+    noise = params["noise"]
+    artifacting = params["artifacting"]
+
+    print(f"[DEBUG] Starting apply_effects with input: {input_path}")
+    # (function, kwargs) for each enabled stage, in order
+    stages = []
+
+    # Step 1: Noise Overlay (applied first)
+    if noise["enabled"]:
+        noise_type_map = {
+            "Gaussian": "gaussian",
+            "Film Grain": "film_grain",
+            "Salt & Pepper": "salt_pepper",
+        }
+        noise_type = noise_type_map.get(noise["type"], "gaussian")
+
+        stages.append(
+            (
+                apply_noise_overlay_array,
+                dict(intensity=noise["intensity"] / 100, noise_type=noise_type),
+            )
+        )
+
+    # Step 2: Artifacting
+    if artifacting["enabled"]:
+        artifact_type_map = {
+            "JPEG Compression": "jpeg",
+            "VHS Tracking": "vhs",
+            "Digital Glitch": "digital_glitch",
+            "Color Bleed": "color_bleed",
+        }
+        artifact_type = artifact_type_map.get(artifacting["type"], "jpeg")
+
+        stages.append(
+            (
+                apply_artifacting_array,
+                dict(
+                    intensity=artifacting["intensity"] / 100,
+                    artifact_type=artifact_type,
+                ),
+            )
+        )
+
+    # Steps 3-5: Channel swap, RGB shift, chromatic aberration. These are
+    # all per-pixel lookups, so whichever are enabled run as a single pass
+    swap_map = {
+        "None": "rgb",
+        "RGB→RBG": "rbg",
+        "RGB→GRB": "grb",
+        "RGB→GBR": "gbr",
+        "RGB→BRG": "brg",
+        "RGB→BGR": "bgr",
+    }
+    swap_mode = swap_map[rgb["channel_swap"]]
+    shifted = rgb["red_shift"] != 0 or rgb["green_shift"] != 0 or rgb["blue_shift"] != 0
+    aberration = rgb["chromatic_aberration"] * scale
+    if shifted or aberration > 0:
+        stages.append(
+            (
+                apply_rgb_shift_array,
+                dict(
+                    red_x=round(rgb["red_shift"] * scale),
+                    green_x=round(rgb["green_shift"] * scale),
+                    blue_x=round(rgb["blue_shift"] * scale),
+                    swap_mode=swap_mode,
+                    aberration=aberration,
+                ),
+            )
+        )
+    elif swap_mode != "rgb":
+        stages.append((apply_channel_swap_array, dict(mode=swap_mode)))
+
+    # Step 6: Pixel sorting
+    # Skip sorting if "No Sort" is checked
+    if not sorting["no_sort"]:
+        if sorting["sort_all"]:
+            stages.append(
+                (
+                    sort_all_pixels_array,
+                    dict(mode=sorting["mode"], reverse=sorting["reverse"]),
+                )
+            )
+        else:
+            stages.append(
+                (
+                    sort_pixels_parallel_array,
+                    dict(
+                        mode=sorting["mode"],
+                        direction=sorting["direction"],
+                        threshold=sorting["threshold"],
+                        reverse=sorting["reverse"],
+                    ),
+                )
+            )
+
+    # Step 7: CRT Filter
+    if crt["enabled"]:
+        stages.append(
+            (
+                apply_crt_filter_array,
+                dict(
+                    hard_scan=-crt["scanline_intensity"],
+                    display_warp_x=crt["curvature"] / 1000,
+                    display_warp_y=crt["curvature"] / 1000,
+                    brightness=crt["brightness"] / 100,
+                    scanline_intensity=crt["scanline_intensity"] / 100,
+                    scanline_thickness=crt["scanline_thickness"],
+                    scanline_count=crt["scanline_count"],
+                    phosphor_glow=crt["phosphor_glow"] / 100,
+                ),
+            )
+        )
+
+    if not stages and output_path is not None:
+        in_ext = os.path.splitext(input_path)[1].lower()
+        if in_ext == os.path.splitext(output_path)[1].lower():
+            # Nothing to apply and no format change: the input is the result
+            shutil.copyfile(input_path, output_path)
+            return output_path
+
+    # Chain the cache keys: each stage's key includes its input's key
+    stat = os.stat(input_path)
+    source_key = key = (input_path, stat.st_mtime_ns, stat.st_size)
+    keys = []
+    for func, kwargs in stages:
+        key = (func.__name__, key, tuple(sorted(kwargs.items())))
+        keys.append(key)
+
+    # Resume after the last stage whose result is cached
+    pixels = None
+    start = 0
+    if is_preview:
+        for i in range(len(stages), 0, -1):
+            if keys[i - 1] in _stage_cache:
+                _stage_cache.move_to_end(keys[i - 1])
+                pixels = _stage_cache[keys[i - 1]]
+                start = i
+                break
+
+    if pixels is None:
+        pixels = _decode_source(input_path, source_key, is_preview)
+
+    for (func, kwargs), key in zip(stages[start:], keys[start:]):
+        if is_preview and _cancel_event is not None and _cancel_event.is_set():
+            print("[DEBUG] Preview cancelled")
+            return None
+        pixels = func(pixels, **kwargs)
+        if is_preview:
+            # The stage functions never modify their input, so cached
+            # arrays can be handed to the next stage as they are
+            _stage_cache[key] = pixels
+            while len(_stage_cache) > STAGE_CACHE_SIZE:
+                _stage_cache.popitem(last=False)
+
+    if output_path is None:
+        return pixels
+
+    result = Image.fromarray(pixels)
+    try:
+        result.save(output_path, quality=95)
+    except ValueError:
+        # No format for this extension; the intermediates were always JPEG
+        result.save(output_path, format="JPEG", quality=95)
+
+    return output_path
+
+
+def _decode_source(path, key, is_preview):
+    """Decode the pipeline's input, reusing the last preview source's pixels."""
+    global _source_cache
+    if is_preview and _source_cache is not None and _source_cache[0] == key:
+        return _source_cache[1]
+    pixels = _decode_rgb(path)
+    if is_preview:
+        _source_cache = (key, pixels)
+    return pixels
+
+
+def _decode_rgb(path):
+    """Decode an image file to a read-only uint8 RGB array.
+
+    Holds as few full-size copies as it can: convert() copies even when the
+    image is already RGB, np.array() would copy the decoded bytes again,
+    and the decoded PIL image is released before the stages run.
+    """
+    with Image.open(path) as img:
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        # Wraps the bytes from tobytes() instead of copying them (read-only,
+        # which is fine: the stage functions never write to their input)
+        pixels = np.asarray(img)
+    del img
+    return pixels
@@ -0,0 +1,36 @@
+"""
+Optional Numba acceleration for the per-pixel effect kernels.
+
+Numba is not required: without it ``njit`` returns the function unchanged
+and ``prange`` is plain ``range``, so every kernel still runs as Python.
+"""
+
+import sys
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    # Kernels are launched from worker threads; the TBB layer hangs the
+    # interpreter on exit once such a thread has finished.
+    numba.config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+
+prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def njit(*args, **kwargs):
+    """Compile with ``numba.njit`` when available, otherwise a no-op decorator."""
+    if not NUMBA_AVAILABLE:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    if getattr(sys, "frozen", False):
+        # Frozen builds have no .py files for Numba to key its disk cache on
+        kwargs.pop("cache", None)
+
+    return numba.njit(*args, **kwargs)
@@ -3,53 +3,77 @@
 import numpy as np
 from PIL import Image
 
+# Random source for the noise; float32 draws from a Generator are much
+# cheaper than the float64 ones from the legacy np.random functions
+_rng = np.random.default_rng()
 
-def apply_noise_overlay(input_path, output_path, intensity=0.1, noise_type="gaussian"):
+
+def apply_noise_overlay_array(pixels, intensity=0.1, noise_type="gaussian"):
     """
-    Apply noise overlay to an image.
+    Apply noise overlay to an image array.
 
     Args:
-        input_path: Path to input image
-        output_path: Path to save output image
+        pixels: uint8 image array (H x W or H x W x C)
         intensity: Noise intensity (0.0 to 1.0)
         noise_type: Type of noise ('gaussian', 'salt_pepper', 'film_grain')
-    """
-    img = Image.open(input_path)
 
-    # Convert to RGB if necessary (for JPEG compatibility)
-    if img.mode in ("RGBA", "LA", "P"):
-        img = img.convert("RGB")
-
-    img_array = np.array(img, dtype=np.float32)
+    Returns:
+        New uint8 array of the same shape
+    """
+    img_array = pixels.astype(np.float32)
 
     if noise_type == "gaussian":
-        # Gaussian noise
-        noise = np.random.normal(0, intensity * 255, img_array.shape)
-        noisy_img = img_array + noise
+        # Gaussian noise, added in place
+        noise = _rng.standard_normal(img_array.shape, dtype=np.float32)
+        noise *= intensity * 255
+        img_array += noise
+        noisy_img = img_array
 
     elif noise_type == "salt_pepper":
-        # Salt and pepper noise
-        noisy_img = img_array.copy()
+        # Salt and pepper noise (img_array is already a copy)
+        noisy_img = img_array
+        shape = img_array.shape[:2]
         # Salt
-        salt_mask = np.random.random(img_array.shape[:2]) < (intensity / 2)
+        salt_mask = _rng.random(shape, dtype=np.float32) < (intensity / 2)
         noisy_img[salt_mask] = 255
         # Pepper
-        pepper_mask = np.random.random(img_array.shape[:2]) < (intensity / 2)
+        pepper_mask = _rng.random(shape, dtype=np.float32) < (intensity / 2)
         noisy_img[pepper_mask] = 0
 
     elif noise_type == "film_grain":
         # Film grain - monochrome noise with reduced intensity
-        grain = np.random.normal(0, intensity * 128, img_array.shape[:2])
-        # Expand grain to all channels
+        grain = _rng.standard_normal(img_array.shape[:2], dtype=np.float32)
+        grain *= intensity * 128
+        # Broadcast the grain across all channels
         if len(img_array.shape) == 3:
-            grain = np.stack([grain] * img_array.shape[2], axis=2)
-        noisy_img = img_array + grain
+            grain = grain[:, :, np.newaxis]
+        img_array += grain
+        noisy_img = img_array
 
     else:
         noisy_img = img_array
 
     # Clip values to valid range
-    noisy_img = np.clip(noisy_img, 0, 255).astype(np.uint8)
+    return np.clip(noisy_img, 0, 255, out=noisy_img).astype(np.uint8)
+
+
+def apply_noise_overlay(input_path, output_path, intensity=0.1, noise_type="gaussian"):
+    """
+    Apply noise overlay to an image.
+
+    Args:
+        input_path: Path to input image
+        output_path: Path to save output image
+        intensity: Noise intensity (0.0 to 1.0)
+        noise_type: Type of noise ('gaussian', 'salt_pepper', 'film_grain')
+    """
+    img = Image.open(input_path)
+
+    # Convert to RGB if necessary (for JPEG compatibility)
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGB")
+
+    noisy_img = apply_noise_overlay_array(np.array(img), intensity, noise_type)
 
     # Create result image with proper mode
     if len(noisy_img.shape) == 2:
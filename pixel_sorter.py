@@ -2,9 +2,9 @@ import numpy as np
 from PIL import Image
 
 
-def brightness(pixel):
-    """Calculate brightness of a pixel (RGB)."""
-    return sum(pixel[:3]) / 3
+def brightness(pixels):
+    """Calculate brightness of RGB pixels (a pixel or an ... x 3 array)."""
+    return np.asarray(pixels)[..., :3].sum(axis=-1) / 3
 
 
 def sort_pixels(
@@ -36,15 +36,17 @@ def sort_pixels(
 
     height, width, _ = pixels.shape
 
+    # Sort keys for the whole image at once rather than per section
+    keys = sort_keys(pixels, mode)
+
     # Sort each row
     for i in range(height):
         row = pixels[i]
         intervals = get_sort_intervals(row, threshold)
 
         for start, end in intervals:
-            section = row[start:end]
-            sorted_section = sort_section(section, mode, reverse)
-            row[start:end] = sorted_section
+            order = sorted_order(keys[i, start:end], reverse)
+            row[start:end] = row[start:end][order]
 
         pixels[i] = row
 
@@ -52,7 +54,7 @@ def sort_pixels(
         pixels = np.transpose(pixels, (1, 0, 2))
 
     # Save result
-    result_img = Image.fromarray(pixels.astype("uint8"))
+    result_img = Image.fromarray(pixels)
     result_img.save(output_path)
     print(f"Sorted image saved to {output_path}")
 
@@ -62,66 +64,63 @@ def get_sort_intervals(row, threshold):
     Find intervals in the row where pixels should be sorted.
     Sorting occurs between pixels darker than threshold.
     """
-    intervals = []
-    start = None
-
-    for i, pixel in enumerate(row):
-        if brightness(pixel) < threshold:
-            if start is not None:
-                intervals.append((start, i))
-                start = None
-        else:
-            if start is None:
-                start = i
+    # Intervals are the runs of pixels at or above the threshold; the mask
+    # flips at each start and end, so those alternate
+    mask = brightness(row) >= threshold
+    edges = np.flatnonzero(np.diff(mask, prepend=False, append=False))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
 
-    if start is not None:
-        intervals.append((start, len(row)))
 
-    return intervals
+def sort_section(section, mode, reverse):
+    return section[sorted_order(sort_keys(section, mode), reverse)]
 
 
-def sort_section(section, mode, reverse):
-    if mode == "brightness":
-        key_func = lambda p: brightness(p)
-    elif mode == "red":
-        key_func = lambda p: p[0]
-    elif mode == "green":
-        key_func = lambda p: p[1]
-    elif mode == "blue":
-        key_func = lambda p: p[2]
+def sort_keys(pixels, mode):
+    """Sort key of every pixel in an (... x 3) array, as an array."""
+    if mode in ("red", "green", "blue"):
+        return pixels[..., ("red", "green", "blue").index(mode)].astype(np.int32)
     elif mode == "hue":
-        key_func = lambda p: rgb_to_hsv(p)[0]
+        return rgb_to_hsv(pixels)[0]
     elif mode == "saturation":
-        key_func = lambda p: rgb_to_hsv(p)[1]
-    else:
-        key_func = lambda p: brightness(p)
+        return rgb_to_hsv(pixels)[1]
 
-    # Convert to list for sorting
-    section_list = [tuple(pixel) for pixel in section]
-    sorted_section = sorted(section_list, key=key_func, reverse=reverse)
+    # Brightness; the channel sum orders the same as the mean
+    return pixels[..., :3].sum(axis=-1, dtype=np.int32)
 
-    return np.array(sorted_section)
 
+def sorted_order(keys, reverse):
+    """
+    Indices that sort keys the way sorted() would.
 
-def rgb_to_hsv(pixel):
-    """Convert RGB pixel to HSV values."""
-    r, g, b = pixel[0] / 255.0, pixel[1] / 255.0, pixel[2] / 255.0
-    max_val = max(r, g, b)
-    min_val = min(r, g, b)
-    diff = max_val - min_val
+    Stable both ways: with reverse, equal keys keep their original order
+    rather than being flipped, as with sorted(reverse=True).
+    """
+    return np.argsort(-keys if reverse else keys, kind="stable")
 
-    # Hue calculation
-    if diff == 0:
-        h = 0
-    elif max_val == r:
-        h = (60 * ((g - b) / diff) + 360) % 360
-    elif max_val == g:
-        h = (60 * ((b - r) / diff) + 120) % 360
-    else:
-        h = (60 * ((r - g) / diff) + 240) % 360
 
-    # Saturation calculation
-    s = 0 if max_val == 0 else (diff / max_val)
+def rgb_to_hsv(pixels):
+    """Convert RGB pixels (... x 3 array) to HSV value arrays."""
+    rgb = np.asarray(pixels) / 255.0
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    max_val = rgb.max(axis=-1)
+    min_val = rgb.min(axis=-1)
+    diff = max_val - min_val
+
+    # Hue calculation; every branch is computed for every pixel, and the
+    # ones dividing by a zero diff are discarded by the select
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h = np.select(
+            [diff == 0, max_val == r, max_val == g],
+            [
+                0.0,
+                (60 * ((g - b) / diff) + 360) % 360,
+                (60 * ((b - r) / diff) + 120) % 360,
+            ],
+            (60 * ((r - g) / diff) + 240) % 360,
+        )
+
+        # Saturation calculation
+        s = np.where(max_val == 0, 0.0, diff / max_val)
 
     # Value
     v = max_val
@@ -149,6 +148,6 @@ def sort_all_pixels(image_path, output_path, mode="brightness", reverse=False):
     result = sorted_pixels.reshape(height, width, 3)
 
     # Save
-    result_img = Image.fromarray(result.astype("uint8"))
+    result_img = Image.fromarray(result)
     result_img.save(output_path)
     print(f"Sorted image saved to {output_path}")
@@ -4,98 +4,180 @@ from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import multiprocessing
 import os
 
+from jit import NUMBA_AVAILABLE, njit, prange
 
-def brightness(pixel):
-    """Calculate brightness of a pixel (RGB)."""
-    return (int(pixel[0]) + int(pixel[1]) + int(pixel[2])) / 3.0
+# Channel index of each single-channel sort mode
+KEY_CHANNELS = {'red': 0, 'green': 1, 'blue': 2}
+
+
+def brightness(pixels):
+    """Calculate brightness of RGB pixels (a pixel or an ... x 3 array)."""
+    return np.asarray(pixels)[..., :3].sum(axis=-1) / 3.0
 
 
 def get_sort_intervals(row, threshold):
     """Find intervals in the row where pixels should be sorted."""
-    intervals = []
-    start = None
-    
-    for i, pixel in enumerate(row):
-        if brightness(pixel) < threshold:
-            if start is not None:
-                intervals.append((start, i))
-                start = None
-        else:
-            if start is None:
-                start = i
-    
-    if start is not None:
-        intervals.append((start, len(row)))
-    
-    return intervals
+    # Intervals are the runs of pixels at or above the threshold; the mask
+    # flips at each start and end, so those alternate
+    mask = brightness(row) >= threshold
+    edges = np.flatnonzero(np.diff(mask, prepend=False, append=False))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
 
 
 def sort_section(section, mode, reverse):
     """Sort a section of pixels based on the specified mode."""
-    if mode == 'brightness':
-        key_func = lambda p: brightness(p)
-    elif mode == 'red':
-        key_func = lambda p: p[0]
-    elif mode == 'green':
-        key_func = lambda p: p[1]
-    elif mode == 'blue':
-        key_func = lambda p: p[2]
+    return section[sorted_order(sort_keys(section, mode), reverse)]
+
+
+def sort_keys(pixels, mode):
+    """Sort key of every pixel in an (... x 3) array, as an array."""
+    if mode in ('red', 'green', 'blue'):
+        return pixels[..., ('red', 'green', 'blue').index(mode)].astype(np.int32)
     elif mode == 'hue':
-        key_func = lambda p: rgb_to_hsv(p)[0]
+        return rgb_to_hsv(pixels)[0]
     elif mode == 'saturation':
-        key_func = lambda p: rgb_to_hsv(p)[1]
-    else:
-        key_func = lambda p: brightness(p)
+        return rgb_to_hsv(pixels)[1]
     
-    section_list = [tuple(pixel) for pixel in section]
-    sorted_section = sorted(section_list, key=key_func, reverse=reverse)
+    # Brightness; the channel sum orders the same as the mean
+    return pixels[..., :3].sum(axis=-1, dtype=np.int32)
+
+
+def sorted_order(keys, reverse):
+    """
+    Indices that sort keys the way sorted() would.
     
-    return np.array(sorted_section)
+    Stable both ways: with reverse, equal keys keep their original order
+    rather than being flipped, as with sorted(reverse=True).
+    """
+    return np.argsort(-keys if reverse else keys, kind='stable')
 
 
-def rgb_to_hsv(pixel):
-    """Convert RGB pixel to HSV values."""
-    r, g, b = pixel[0] / 255.0, pixel[1] / 255.0, pixel[2] / 255.0
-    max_val = max(r, g, b)
-    min_val = min(r, g, b)
+def rgb_to_hsv(pixels):
+    """Convert RGB pixels (... x 3 array) to HSV value arrays."""
+    rgb = np.asarray(pixels) / 255.0
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    max_val = rgb.max(axis=-1)
+    min_val = rgb.min(axis=-1)
     diff = max_val - min_val
     
-    if diff == 0:
-        h = 0
-    elif max_val == r:
-        h = (60 * ((g - b) / diff) + 360) % 360
-    elif max_val == g:
-        h = (60 * ((b - r) / diff) + 120) % 360
-    else:
-        h = (60 * ((r - g) / diff) + 240) % 360
-    
-    s = 0 if max_val == 0 else (diff / max_val)
+    # Every branch is computed for every pixel; the ones dividing by a zero
+    # diff are discarded by the select
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.select(
+            [diff == 0, max_val == r, max_val == g],
+            [0.0,
+             (60 * ((g - b) / diff) + 360) % 360,
+             (60 * ((b - r) / diff) + 120) % 360],
+            (60 * ((r - g) / diff) + 240) % 360)
+        s = np.where(max_val == 0, 0.0, diff / max_val)
     v = max_val
     
     return h, s, v
 
 
 def process_row(args):
-    """Process a single row - designed for parallel execution."""
-    row_index, row, mode, threshold, reverse = args
+    """
+    Process a single row - designed for parallel execution.
+    
+    The row is sorted in place, and returned with its index.
+    """
+    row_index, row, row_keys, threshold, reverse = args
     
     intervals = get_sort_intervals(row, threshold)
     
     for start, end in intervals:
-        section = row[start:end]
-        sorted_section = sort_section(section, mode, reverse)
-        row[start:end] = sorted_section
+        order = sorted_order(row_keys[start:end], reverse)
+        row[start:end] = row[start:end][order]
     
     return row_index, row
 
 
+@njit(cache=True)
+def _channel_sum(pixel):
+    """Sum of a pixel's channels, without uint8 overflow."""
+    return int(pixel[0]) + int(pixel[1]) + int(pixel[2])
+
+
+@njit(cache=True)
+def _next_interval(row, x, threshold):
+    """
+    Start and end of the first interval of row at or after x, as found by
+    get_sort_intervals; both are the row's width once there are none left.
+    """
+    width = row.shape[0]
+    # Skip to the next pixel at or above the threshold
+    while x < width and _channel_sum(row[x]) / 3.0 < threshold:
+        x += 1
+    start = x
+    while x < width and _channel_sum(row[x]) / 3.0 >= threshold:
+        x += 1
+    return start, x
+
+
+@njit(cache=True)
+def _reorder(row, start, order):
+    """Rearrange the interval of row starting at start by order."""
+    section = row[start:start + order.shape[0]].copy()
+    for i in range(order.shape[0]):
+        row[start + i] = section[order[i]]
+
+
+@njit(parallel=True, cache=True)
+def _sort_rows(pixels, keys, threshold, reverse):
+    """
+    process_row for every row of pixels, in place and parallel across rows.
+    
+    Finds the same intervals as get_sort_intervals and orders each one by
+    a stable argsort of its keys, as sorted_order does.
+    """
+    height, width = pixels.shape[:2]
+    for y in prange(height):
+        row = pixels[y]
+        row_keys = keys[y]
+        start, end = _next_interval(row, 0, threshold)
+        while start < end:
+            if reverse:
+                order = np.argsort(-row_keys[start:end], kind='mergesort')
+            else:
+                order = np.argsort(row_keys[start:end], kind='mergesort')
+            _reorder(row, start, order)
+            start, end = _next_interval(row, end, threshold)
+
+
+@njit(parallel=True, cache=True)
+def _sort_rows_by_channel(pixels, channel, threshold, reverse):
+    """
+    _sort_rows for the brightness and red, green and blue modes.
+    
+    Their keys are cheap enough to work out for each interval as it is
+    sorted, so no key array is built for the whole image first. channel is
+    the channel to sort by, or -1 for brightness (the channel sum, which
+    orders the same as the mean).
+    """
+    height, width = pixels.shape[:2]
+    for y in prange(height):
+        row = pixels[y]
+        start, end = _next_interval(row, 0, threshold)
+        while start < end:
+            keys = np.empty(end - start, dtype=np.int32)
+            for i in range(end - start):
+                if channel < 0:
+                    key = _channel_sum(row[start + i])
+                else:
+                    key = int(row[start + i, channel])
+                keys[i] = -key if reverse else key
+            _reorder(row, start, np.argsort(keys, kind='mergesort'))
+            start, end = _next_interval(row, end, threshold)
+
+
 def sort_pixels_parallel(image_path, output_path, mode='brightness', direction='horizontal', 
                         threshold=100, reverse=False, preview_mode=False, num_threads=None):
     """
     Parallel pixel sorting using multiple CPU cores.
     
     Args:
-        num_threads: Number of threads (None = auto-detect CPU cores)
+        num_threads: Number of threads (None = auto-detect CPU cores);
+            only used without Numba, which runs its own thread pool
         preview_mode: If True, resize for faster preview
     """
     # Load image
@@ -106,7 +188,28 @@ def sort_pixels_parallel(image_path, output_path, mode='brightness', direction='
         img.thumbnail((800, 800), Image.Resampling.LANCZOS)
     
     img = img.convert('RGB')
-    pixels = np.array(img)
+    pixels = sort_pixels_parallel_array(np.array(img), mode, direction,
+                                        threshold, reverse, num_threads)
+    
+    # Save result
+    result_img = Image.fromarray(pixels)
+    result_img.save(output_path, quality=100)
+    
+    return output_path
+
+
+def sort_pixels_parallel_array(pixels, mode='brightness', direction='horizontal',
+                               threshold=100, reverse=False, num_threads=None):
+    """
+    Array version of sort_pixels_parallel.
+    
+    Args:
+        pixels: uint8 RGB image array (H x W x 3); left unmodified
+    
+    Returns:
+        New uint8 RGB array
+    """
+    pixels = pixels.copy()
     
     if direction == 'vertical':
         pixels = np.transpose(pixels, (1, 0, 2))
@@ -117,44 +220,56 @@ def sort_pixels_parallel(image_path, output_path, mode='brightness', direction='
     if num_threads is None:
         num_threads = max(1, multiprocessing.cpu_count() - 1)  # Leave one core free
     
-    # Prepare work items
-    work_items = [(i, pixels[i].copy(), mode, threshold, reverse) for i in range(height)]
+    if NUMBA_AVAILABLE:
+        # Compiled rows run outside the GIL, so Numba's own threads share
+        # them out; the thread pool below would only serialize them. The
+        # mode picks the kernel once, here, rather than per row or interval.
+        if mode in ('hue', 'saturation'):
+            _sort_rows(pixels, sort_keys(pixels, mode), threshold, reverse)
+        else:
+            channel = KEY_CHANNELS.get(mode, -1)  # Brightness otherwise
+            _sort_rows_by_channel(pixels, channel, threshold, reverse)
+        if direction == 'vertical':
+            pixels = np.transpose(pixels, (1, 0, 2))
+        return pixels
+    
+    # Sort keys for the whole image at once rather than per section
+    keys = sort_keys(pixels, mode)
+    
+    # Prepare work items; each row is a view of pixels, which process_row
+    # sorts in place, so no row is copied out and back
+    work_items = [(i, pixels[i], keys[i], threshold, reverse) for i in range(height)]
     
     # Process rows in parallel using ThreadPoolExecutor
     # (ThreadPoolExecutor is better than ProcessPoolExecutor for this due to less overhead)
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        results = list(executor.map(process_row, work_items))
-    
-    # Reconstruct image from results
-    for row_index, sorted_row in results:
-        pixels[row_index] = sorted_row
+        list(executor.map(process_row, work_items))
     
     if direction == 'vertical':
         pixels = np.transpose(pixels, (1, 0, 2))
     
-    # Save result
-    result_img = Image.fromarray(pixels.astype('uint8'))
-    result_img.save(output_path, quality=100)
-    
-    return output_path
+    return pixels
 
 
 def sort_all_pixels(image_path, output_path, mode='brightness', reverse=False):
     """Sort ALL pixels in the image without intervals."""
     img = Image.open(image_path)
     img = img.convert('RGB')
-    pixels = np.array(img)
+    result = sort_all_pixels_array(np.array(img), mode, reverse)
     
-    height, width, _ = pixels.shape
-    flat_pixels = pixels.reshape(-1, 3)
-    sorted_pixels = sort_section(flat_pixels, mode, reverse)
-    result = sorted_pixels.reshape(height, width, 3)
-    
-    result_img = Image.fromarray(result.astype('uint8'))
+    result_img = Image.fromarray(result)
     result_img.save(output_path)
     
     return output_path
 
 
+def sort_all_pixels_array(pixels, mode='brightness', reverse=False):
+    """Array version of sort_all_pixels; returns a new uint8 RGB array."""
+    height, width, _ = pixels.shape
+    flat_pixels = pixels.reshape(-1, 3)
+    sorted_pixels = sort_section(flat_pixels, mode, reverse)
+    return sorted_pixels.reshape(height, width, 3)
+
+
 # Alias for compatibility
 sort_pixels_optimized = sort_pixels_parallel
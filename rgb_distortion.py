@@ -1,6 +1,141 @@
 import numpy as np
 from PIL import Image
 
+from jit import NUMBA_AVAILABLE, njit, prange
+
+# Channel indices for each apply_channel_swap mode
+CHANNEL_ORDERS = {
+    'rgb': [0, 1, 2],  # No change
+    'rbg': [0, 2, 1],  # Swap green and blue
+    'grb': [1, 0, 2],  # Swap red and green
+    'gbr': [1, 2, 0],  # Rotate right
+    'brg': [2, 0, 1],  # Rotate left
+    'bgr': [2, 1, 0],  # Reverse
+}
+
+
+def _shift_channel(pixels, result, c, src_c, shift_x, shift_y):
+    """
+    Copy channel src_c of pixels into channel c of result, offset by
+    (shift_x, shift_y).
+    
+    The overlapping region is a single strided slice copy; the border
+    it uncovers is left as it is in result.
+    """
+    height, width = pixels.shape[:2]
+    if abs(shift_x) >= width or abs(shift_y) >= height:
+        return
+    result[max(shift_y, 0):height + min(shift_y, 0),
+           max(shift_x, 0):width + min(shift_x, 0), c] = \
+        pixels[max(-shift_y, 0):height + min(-shift_y, 0),
+               max(-shift_x, 0):width + min(-shift_x, 0), src_c]
+
+
+@njit(parallel=True, cache=True)
+def _chromatic_aberration(pixels, result, strength):
+    """Push red outward and blue inward from the image center."""
+    height, width = pixels.shape[:2]
+    center_x = width / 2
+    center_y = height / 2
+    for y in prange(height):
+        for x in range(width):
+            # Calculate direction from center
+            dx = (x - center_x) / center_x
+            dy = (y - center_y) / center_y
+            
+            # Red channel - shift outward
+            src_x_r = int(x - dx * strength)
+            src_y_r = int(y - dy * strength)
+            if 0 <= src_y_r < height and 0 <= src_x_r < width:
+                result[y, x, 0] = pixels[src_y_r, src_x_r, 0]
+            
+            # Green channel - no shift
+            result[y, x, 1] = pixels[y, x, 1]
+            
+            # Blue channel - shift inward
+            src_x_b = int(x + dx * strength)
+            src_y_b = int(y + dy * strength)
+            if 0 <= src_y_b < height and 0 <= src_x_b < width:
+                result[y, x, 2] = pixels[src_y_b, src_x_b, 2]
+
+
+@njit(parallel=True, cache=True)
+def _shift_and_aberrate(pixels, result, red_x, red_y, green_x, green_y,
+                        blue_x, blue_y, red_c, green_c, blue_c, strength):
+    """
+    _shift_channel for each channel followed by _chromatic_aberration,
+    in one pass.
+    
+    Each output pixel composes the two lookups directly, so the shifted
+    image is never materialized; a source outside the image at either
+    step leaves the pixel black, exactly as running the two in turn does.
+    """
+    height, width = pixels.shape[:2]
+    center_x = width / 2
+    center_y = height / 2
+    for y in prange(height):
+        for x in range(width):
+            dx = (x - center_x) / center_x
+            dy = (y - center_y) / center_y
+            
+            # Red channel - shift outward, then by the red offset
+            ab_x = int(x - dx * strength)
+            ab_y = int(y - dy * strength)
+            if 0 <= ab_y < height and 0 <= ab_x < width:
+                src_y = ab_y - red_y
+                src_x = ab_x - red_x
+                if 0 <= src_y < height and 0 <= src_x < width:
+                    result[y, x, 0] = pixels[src_y, src_x, red_c]
+            
+            # Green channel - green offset only
+            src_y = y - green_y
+            src_x = x - green_x
+            if 0 <= src_y < height and 0 <= src_x < width:
+                result[y, x, 1] = pixels[src_y, src_x, green_c]
+            
+            # Blue channel - shift inward, then by the blue offset
+            ab_x = int(x + dx * strength)
+            ab_y = int(y + dy * strength)
+            if 0 <= ab_y < height and 0 <= ab_x < width:
+                src_y = ab_y - blue_y
+                src_x = ab_x - blue_x
+                if 0 <= src_y < height and 0 <= src_x < width:
+                    result[y, x, 2] = pixels[src_y, src_x, blue_c]
+
+
+def _aberration_indices(size, shift, strength):
+    """
+    Output and source positions along one axis for _shift_and_aberrate_numpy.
+    
+    The aberration offset along an axis depends only on the position
+    along that axis, so each axis gets its own 1-D index arrays, keeping
+    only the positions whose source lands inside the image at both steps.
+    """
+    center = size / 2
+    pos = np.arange(size)
+    ab = (pos + (pos - center) / center * strength).astype(np.intp)
+    src = ab - shift
+    inside = (ab >= 0) & (ab < size) & (src >= 0) & (src < size)
+    return np.flatnonzero(inside), src[inside]
+
+
+def _shift_and_aberrate_numpy(pixels, result, red_x, red_y, green_x, green_y,
+                              blue_x, blue_y, red_c, green_c, blue_c, strength):
+    """
+    Vectorized _shift_and_aberrate, for when Numba isn't available.
+    
+    Each channel is one gather through a row and a column index array,
+    rather than a Python loop over every pixel; the result is the same.
+    """
+    height, width = pixels.shape[:2]
+    channels = ((0, red_c, red_x, red_y, -strength),
+                (1, green_c, green_x, green_y, 0),
+                (2, blue_c, blue_x, blue_y, strength))
+    for c, src_c, shift_x, shift_y, channel_strength in channels:
+        out_x, src_x = _aberration_indices(width, shift_x, channel_strength)
+        out_y, src_y = _aberration_indices(height, shift_y, channel_strength)
+        result[out_y[:, None], out_x, c] = pixels[src_y[:, None], src_x, src_c]
+
 
 def apply_rgb_shift(image_path, output_path, 
                     red_x=0, red_y=0,
@@ -21,38 +156,56 @@ def apply_rgb_shift(image_path, output_path,
     img = img.convert('RGB')
     pixels = np.array(img)
     
-    height, width = pixels.shape[:2]
-    result = np.zeros_like(pixels)
-    
-    # Shift each channel
-    for y in range(height):
-        for x in range(width):
-            # Red channel
-            src_y_r = y - red_y
-            src_x_r = x - red_x
-            if 0 <= src_y_r < height and 0 <= src_x_r < width:
-                result[y, x, 0] = pixels[src_y_r, src_x_r, 0]
-            
-            # Green channel
-            src_y_g = y - green_y
-            src_x_g = x - green_x
-            if 0 <= src_y_g < height and 0 <= src_x_g < width:
-                result[y, x, 1] = pixels[src_y_g, src_x_g, 1]
-            
-            # Blue channel
-            src_y_b = y - blue_y
-            src_x_b = x - blue_x
-            if 0 <= src_y_b < height and 0 <= src_x_b < width:
-                result[y, x, 2] = pixels[src_y_b, src_x_b, 2]
+    result = apply_rgb_shift_array(pixels, red_x, red_y,
+                                   green_x, green_y, blue_x, blue_y)
     
     # Save result
-    result_img = Image.fromarray(result.astype('uint8'))
+    result_img = Image.fromarray(result)
     result_img.save(output_path, quality=100)
     
     print(f"✓ RGB shift applied: {output_path}")
     return output_path
 
 
+def apply_rgb_shift_array(pixels,
+                          red_x=0, red_y=0,
+                          green_x=0, green_y=0,
+                          blue_x=0, blue_y=0,
+                          swap_mode='rgb', aberration=0):
+    """
+    Array version of apply_rgb_shift.
+    
+    Args:
+        pixels: uint8 RGB image array (H x W x 3)
+        red_x, red_y, green_x, green_y, blue_x, blue_y: Channel offsets in pixels
+        swap_mode: Channel swap to apply before shifting, as for
+            apply_channel_swap; done in the same pass over the image
+        aberration: Chromatic aberration strength to apply after shifting,
+            as for apply_chromatic_aberration; also done in the same pass
+    
+    Returns:
+        New uint8 RGB array; uncovered pixels are black
+    """
+    result = np.zeros_like(pixels)
+    red_c, green_c, blue_c = CHANNEL_ORDERS.get(swap_mode, CHANNEL_ORDERS['rgb'])
+    
+    if aberration > 0:
+        if NUMBA_AVAILABLE:
+            aberrate = _shift_and_aberrate
+        else:
+            aberrate = _shift_and_aberrate_numpy
+        aberrate(pixels, result,
+                 red_x, red_y, green_x, green_y, blue_x, blue_y,
+                 red_c, green_c, blue_c, aberration)
+        return result
+    
+    # Shift each channel
+    _shift_channel(pixels, result, 0, red_c, red_x, red_y)
+    _shift_channel(pixels, result, 1, green_c, green_x, green_y)
+    _shift_channel(pixels, result, 2, blue_c, blue_x, blue_y)
+    return result
+
+
 def apply_channel_scale(image_path, output_path,
                         red_scale=1.0,
                         green_scale=1.0,
@@ -70,15 +223,21 @@ def apply_channel_scale(image_path, output_path,
     # Load image
     img = Image.open(image_path)
     img = img.convert('RGB')
-    pixels = np.array(img).astype(np.float32)
+    pixels = np.array(img)
     
-    # Scale channels
-    pixels[:, :, 0] = np.clip(pixels[:, :, 0] * red_scale, 0, 255)
-    pixels[:, :, 1] = np.clip(pixels[:, :, 1] * green_scale, 0, 255)
-    pixels[:, :, 2] = np.clip(pixels[:, :, 2] * blue_scale, 0, 255)
+    # A uint8 pixel has only 256 values, so each channel's scaled and
+    # clipped result is worked out once per value (in float32, as for
+    # the whole image before) and looked up, with no float copy of the image
+    scales = np.array([red_scale, green_scale, blue_scale], dtype=np.float32)
+    luts = np.arange(256, dtype=np.float32) * scales[:, None]
+    luts = np.clip(luts, 0, 255).astype(np.uint8)
+    
+    result = np.empty_like(pixels)
+    for c in range(3):
+        result[:, :, c] = luts[c].take(pixels[:, :, c])
     
     # Save result
-    result_img = Image.fromarray(pixels.astype('uint8'))
+    result_img = Image.fromarray(result)
     result_img.save(output_path, quality=100)
     
     print(f"✓ Channel scale applied: {output_path}")
@@ -99,32 +258,40 @@ def apply_channel_swap(image_path, output_path, mode='rgb'):
     img = img.convert('RGB')
     pixels = np.array(img)
     
-    result = pixels.copy()
-    
-    # Map mode to channel indices
-    swaps = {
-        'rgb': [0, 1, 2],  # No change
-        'rbg': [0, 2, 1],  # Swap green and blue
-        'grb': [1, 0, 2],  # Swap red and green
-        'gbr': [1, 2, 0],  # Rotate right
-        'brg': [2, 0, 1],  # Rotate left
-        'bgr': [2, 1, 0],  # Reverse
-    }
-    
-    if mode in swaps:
-        order = swaps[mode]
-        result[:, :, 0] = pixels[:, :, order[0]]
-        result[:, :, 1] = pixels[:, :, order[1]]
-        result[:, :, 2] = pixels[:, :, order[2]]
+    result = apply_channel_swap_array(pixels, mode)
     
     # Save result
-    result_img = Image.fromarray(result.astype('uint8'))
+    result_img = Image.fromarray(result)
     result_img.save(output_path, quality=100)
     
     print(f"✓ Channel swap ({mode}) applied: {output_path}")
     return output_path
 
 
+def apply_channel_swap_array(pixels, mode='rgb'):
+    """
+    Array version of apply_channel_swap.
+    
+    Args:
+        pixels: uint8 RGB image array (H x W x 3)
+        mode: Channel order - 'rgb', 'rbg', 'grb', 'gbr', 'brg', 'bgr'
+    
+    Returns:
+        New uint8 RGB array
+    """
+    order = CHANNEL_ORDERS.get(mode)
+    if order is None:
+        return pixels.copy()
+    
+    # Fill an uninitialized array channel by channel; pixels[:, :, order]
+    # is no faster and returns a non-C-contiguous array
+    result = np.empty_like(pixels)
+    result[:, :, 0] = pixels[:, :, order[0]]
+    result[:, :, 1] = pixels[:, :, order[1]]
+    result[:, :, 2] = pixels[:, :, order[2]]
+    return result
+
+
 def apply_chromatic_aberration(image_path, output_path, strength=5):
     """
     Apply chromatic aberration (lens distortion) effect.
@@ -140,43 +307,36 @@ def apply_chromatic_aberration(image_path, output_path, strength=5):
     img = img.convert('RGB')
     pixels = np.array(img)
     
-    height, width = pixels.shape[:2]
-    result = np.zeros_like(pixels)
-    
-    center_x = width / 2
-    center_y = height / 2
-    
-    for y in range(height):
-        for x in range(width):
-            # Calculate direction from center
-            dx = (x - center_x) / center_x
-            dy = (y - center_y) / center_y
-            
-            # Red channel - shift outward
-            offset_r = strength
-            src_x_r = int(x - dx * offset_r)
-            src_y_r = int(y - dy * offset_r)
-            if 0 <= src_y_r < height and 0 <= src_x_r < width:
-                result[y, x, 0] = pixels[src_y_r, src_x_r, 0]
-            
-            # Green channel - no shift
-            result[y, x, 1] = pixels[y, x, 1]
-            
-            # Blue channel - shift inward
-            offset_b = -strength
-            src_x_b = int(x - dx * offset_b)
-            src_y_b = int(y - dy * offset_b)
-            if 0 <= src_y_b < height and 0 <= src_x_b < width:
-                result[y, x, 2] = pixels[src_y_b, src_x_b, 2]
+    result = apply_chromatic_aberration_array(pixels, strength)
     
     # Save result
-    result_img = Image.fromarray(result.astype('uint8'))
+    result_img = Image.fromarray(result)
     result_img.save(output_path, quality=100)
     
     print(f"✓ Chromatic aberration applied: {output_path}")
     return output_path
 
 
+def apply_chromatic_aberration_array(pixels, strength=5):
+    """
+    Array version of apply_chromatic_aberration.
+    
+    Args:
+        pixels: uint8 RGB image array (H x W x 3)
+        strength: Aberration strength in pixels
+    
+    Returns:
+        New uint8 RGB array
+    """
+    result = np.zeros_like(pixels)
+    if NUMBA_AVAILABLE:
+        _chromatic_aberration(pixels, result, strength)
+    else:
+        _shift_and_aberrate_numpy(pixels, result, 0, 0, 0, 0, 0, 0,
+                                  0, 1, 2, strength)
+    return result
+
+
 if __name__ == '__main__':
     # Example usage
     apply_rgb_shift(